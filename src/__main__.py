@@ -25,6 +25,7 @@ Usage:
 """
 
 import argparse
+import atexit
 import json
 import logging
 import os
@@ -216,6 +217,8 @@ def main() -> None:
         agent_id=args.agent_id,
         config_path=args.config_path,
     )
+    # Runs on sys.exit() too, which several commands use to report their status
+    atexit.register(orch.close)
 
     if args.command == "idle-check":
         result = orch.idle_check()
@@ -242,7 +245,7 @@ def main() -> None:
         print(json.dumps(result, indent=2, default=str))
 
     elif args.command == "gateway-watchdog":
-        from gateway_watchdog import GatewayWatchdog  # noqa: E402
+        from gateway_watchdog import DOWN_STATUSES, GatewayWatchdog  # noqa: E402
 
         kwargs: dict[str, object] = {"state_dir": args.state_dir or ""}
         if args.port:
@@ -252,7 +255,7 @@ def main() -> None:
         watchdog = GatewayWatchdog(**kwargs)  # type: ignore[arg-type]
         result = watchdog.run_check()
         print(json.dumps(result, indent=2, default=str))
-        if result.get("status") == "down":
+        if result.get("status") in DOWN_STATUSES:
             sys.exit(2)
 
     elif args.command == "cost-audit":
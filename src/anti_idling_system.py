@@ -2,7 +2,9 @@
 
 import logging
 import time
+from collections import deque
 from collections.abc import Callable
+from itertools import islice
 from typing import Any
 
 
@@ -23,7 +25,8 @@ class AntiIdlingSystem:
         self.idle_threshold = idle_threshold
         self.minimum_productive_actions = minimum_productive_actions
         self._running = False
-        self.activity_log: list[dict[str, Any]] = []
+        # FIFO-capped at 100 entries; deque evicts the oldest on append
+        self.activity_log: deque[dict[str, Any]] = deque(maxlen=100)
         self.intervention_callbacks: list[Callable] = []
         self.action_handlers: dict[str, Callable] = {}
 
@@ -41,10 +44,6 @@ class AntiIdlingSystem:
         entry = {**activity, "timestamp": current_time}
         self.activity_log.append(entry)
 
-        # Periodically clean old logs (keep last 100 entries)
-        if len(self.activity_log) > 100:
-            self.activity_log = self.activity_log[-100:]
-
     def calculate_idle_rate(self, time_window: int = 86400) -> float:
         """
         Calculate idle rate within a given time window
@@ -55,21 +54,15 @@ class AntiIdlingSystem:
         if time_window <= 0:
             raise ValueError(f"time_window must be > 0, got {time_window}")
 
-        current_time = time.time()
-        recent_activities = [
-            activity
-            for activity in self.activity_log
-            if current_time - activity["timestamp"] <= time_window
-        ]
-
-        total_time = time_window
+        # One pass over the (maxlen-bounded) log, no intermediate list of recent entries
+        cutoff = time.time() - time_window
         productive_time = sum(
             activity.get("duration", 0)
-            for activity in recent_activities
-            if activity.get("is_productive", False)
+            for activity in self.activity_log
+            if activity["timestamp"] >= cutoff and activity.get("is_productive", False)
         )
 
-        idle_rate: float = 1 - (productive_time / total_time)
+        idle_rate: float = 1 - (productive_time / time_window)
         return max(0.0, min(1.0, idle_rate))
 
     def register_action_handler(self, action_name: str, handler: Callable) -> None:
@@ -151,7 +144,7 @@ class AntiIdlingSystem:
             return full_pool
 
         # Analyze last 20 entries for type distribution
-        recent = self.activity_log[-20:]
+        recent = islice(self.activity_log, max(len(self.activity_log) - 20, 0), None)
         type_counts: dict[str, int] = {}
         for entry in recent:
             activity_type = entry.get("type", "unknown")
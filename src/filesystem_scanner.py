@@ -46,17 +46,16 @@ class FilesystemScanner:
         except Exception as e:
             logger.debug("File scan failed: %s", e)
 
-        # 3. Daily reflections
+        # 3. Daily reflections (_scan_reflections returns [] for a missing dir)
         for reflection_dir in [
             os.path.join(self.workspace_dir, "memory", "daily-reflections"),
             os.path.join(self.workspace_dir, "memory", "reflections", "daily"),
         ]:
-            if os.path.isdir(reflection_dir):
-                try:
-                    reflections = self._scan_reflections(reflection_dir, hours)
-                    activities.extend(reflections)
-                except Exception as e:
-                    logger.debug("Reflection scan failed: %s", e)
+            try:
+                reflections = self._scan_reflections(reflection_dir, hours)
+                activities.extend(reflections)
+            except Exception as e:
+                logger.debug("Reflection scan failed: %s", e)
 
         # Sort by timestamp descending
         activities.sort(key=lambda a: a.get("timestamp", 0), reverse=True)
@@ -116,40 +115,51 @@ class FilesystemScanner:
         return commits
 
     def get_modified_files(self, directory: str, hours: int = 24) -> list[dict[str, Any]]:
-        """Find files modified within the time window via os.walk + os.stat.
+        """Find files modified within the time window via os.scandir.
 
+        Walks depth-first in os.walk order with an explicit stack; entry types
+        come from the directory listing, so only files are stat'ed.
         Groups by parent directory to estimate work sessions.
         """
-        if not os.path.isdir(directory):
-            return []
-
         cutoff = time.time() - (hours * 3600)
         modified: list[dict[str, Any]] = []
 
         skip_dirs = {".git", "__pycache__", ".mypy_cache", ".pytest_cache", "node_modules", ".venv"}
 
-        for root, dirs, files in os.walk(directory):
-            # Prune hidden/cache dirs
-            dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith(".")]
-            for fname in files:
-                if fname.startswith("."):
+        stack = [directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            subdirs: list[str] = []
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    # Prune hidden/cache dirs; like os.walk, don't descend into symlinked dirs
+                    prune = name in skip_dirs or name.startswith(".")
+                    if not prune and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                if name.startswith("."):
                     continue
-                fpath = os.path.join(root, fname)
                 try:
-                    st = os.stat(fpath)
+                    st = entry.stat()
                 except OSError:
                     continue
                 if st.st_mtime >= cutoff:
                     modified.append(
                         {
                             "type": "file_modification",
-                            "path": fpath,
+                            "path": entry.path,
                             "timestamp": st.st_mtime,
-                            "description": f"Modified: {os.path.relpath(fpath, directory)}",
+                            "description": f"Modified: {os.path.relpath(entry.path, directory)}",
                             "is_productive": True,
                             "duration": 300,  # estimate 5 min per file touch
                         }
                     )
+            stack.extend(reversed(subdirs))
 
         return modified
 
@@ -168,9 +178,7 @@ class FilesystemScanner:
             "is_filled": False,
         }
 
-        if not os.path.isfile(filepath):
-            return result
-
+        # open() alone covers missing files and directories; no separate isfile() stat
         try:
             with open(filepath, encoding="utf-8") as f:
                 content = f.read()
@@ -235,14 +243,14 @@ class FilesystemScanner:
         if os.path.isdir(os.path.join(self.workspace_dir, ".git")):
             repos.append(self.workspace_dir)
 
-        # Check immediate subdirectories for git repos
-        if os.path.isdir(self.workspace_dir):
-            try:
-                for entry in os.scandir(self.workspace_dir):
+        # Check immediate subdirectories for git repos (scandir raises if the dir is missing)
+        try:
+            with os.scandir(self.workspace_dir) as entries:
+                for entry in entries:
                     if entry.is_dir() and os.path.isdir(os.path.join(entry.path, ".git")):
                         repos.append(entry.path)
-            except OSError:
-                pass
+        except OSError:
+            pass
         return repos
 
     def _scan_reflections(self, reflection_dir: str, hours: int) -> list[dict[str, Any]]:
@@ -250,25 +258,25 @@ class FilesystemScanner:
         cutoff = time.time() - (hours * 3600)
         activities: list[dict[str, Any]] = []
 
-        if not os.path.isdir(reflection_dir):
+        try:
+            with os.scandir(reflection_dir) as it:
+                entries = [entry for entry in it if entry.name.endswith(".md")]
+        except OSError:
             return activities
 
-        for fname in os.listdir(reflection_dir):
-            if not fname.endswith(".md"):
-                continue
-            fpath = os.path.join(reflection_dir, fname)
+        for entry in entries:
             try:
-                st = os.stat(fpath)
+                st = entry.stat()
             except OSError:
                 continue
             if st.st_mtime >= cutoff:
-                parsed = self.parse_daily_reflection(fpath)
+                parsed = self.parse_daily_reflection(entry.path)
                 activities.append(
                     {
                         "type": "daily_reflection",
-                        "path": fpath,
+                        "path": entry.path,
                         "timestamp": st.st_mtime,
-                        "description": f"Reflection: {fname}",
+                        "description": f"Reflection: {entry.name}",
                         "is_productive": True,
                         "duration": 900,  # estimate 15 min for reflection
                         "parsed": parsed,
@@ -12,6 +12,9 @@ import os
 import socket
 import subprocess
 import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
@@ -24,6 +27,11 @@ DEFAULT_RETRY_DELAY = 10  # seconds between restart attempts
 DEFAULT_HEALTH_TIMEOUT = 5  # seconds for TCP probe
 LAUNCHD_LABEL = "ai.openclaw.gateway"
 PLIST_PATH = "~/Library/LaunchAgents/ai.openclaw.gateway.plist"
+OPENCLAW_CONFIG_PATH = "~/.openclaw/openclaw.json"
+DEFAULT_STATE_DIR = "~/.openclaw/workspace/self-optimization/state"
+
+# Watchdog run statuses that mean a service is still unreachable
+DOWN_STATUSES = frozenset({"down", "critical_down"})
 
 # Well-known OpenClaw services
 KNOWN_SERVICES: list[dict[str, Any]] = [
@@ -57,10 +65,10 @@ KNOWN_SERVICES: list[dict[str, Any]] = [
 def probe_port(port: int, timeout: int = DEFAULT_HEALTH_TIMEOUT) -> dict[str, Any]:
     """Probe a TCP port and return health status."""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        sock.connect(("127.0.0.1", port))
-        sock.close()
+        # Context manager releases the FD on failed connects too, not just on success
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(("127.0.0.1", port))
         return {
             "healthy": True,
             "port": port,
@@ -88,7 +96,14 @@ class GatewayWatchdog:
         retry_delay: int = DEFAULT_RETRY_DELAY,
         health_timeout: int = DEFAULT_HEALTH_TIMEOUT,
         services: list[dict[str, Any]] | None = None,
+        runner: Callable[..., subprocess.CompletedProcess[str]] = subprocess.run,
+        sleeper: Callable[[float], None] = time.sleep,
+        config_path: str = "",
     ) -> None:
+        # Injectable for tests: runner executes launchctl, sleeper waits between retries
+        self._runner = runner
+        self._sleeper = sleeper
+        self.config_path = config_path or os.path.expanduser(OPENCLAW_CONFIG_PATH)
         config = self._load_openclaw_config()
 
         # Primary port (backward compat)
@@ -109,10 +124,11 @@ class GatewayWatchdog:
             self.services = self._build_service_list(config)
 
         if not state_dir:
-            state_dir = os.path.expanduser("~/.openclaw/workspace/self-optimization/state")
+            state_dir = os.path.expanduser(DEFAULT_STATE_DIR)
         self.state_dir = state_dir
         os.makedirs(state_dir, exist_ok=True)
         self._state_file = os.path.join(state_dir, "gateway_watchdog.json")
+        self._state_tmp = self._state_file + ".tmp"
 
     def _build_service_list(self, config: dict[str, Any]) -> list[dict[str, Any]]:
         """Build monitored service list from config + well-known ports."""
@@ -160,9 +176,8 @@ class GatewayWatchdog:
 
     def _load_openclaw_config(self) -> dict[str, Any]:
         """Load ~/.openclaw/openclaw.json."""
-        config_path = os.path.expanduser("~/.openclaw/openclaw.json")
         try:
-            with open(config_path, encoding="utf-8") as f:
+            with open(self.config_path, encoding="utf-8") as f:
                 return json.load(f)  # type: ignore[no-any-return]
         except (OSError, json.JSONDecodeError) as e:
             logger.warning("Could not load openclaw config: %s", e)
@@ -173,10 +188,18 @@ class GatewayWatchdog:
         return probe_port(port or self.port, self.health_timeout)
 
     def check_all_services(self) -> dict[str, dict[str, Any]]:
-        """Probe all monitored services and return per-service health."""
+        """Probe all monitored services concurrently and return per-service health."""
+        if not self.services:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(self.services)) as pool:
+            healths = list(
+                pool.map(lambda svc: probe_port(svc["port"], self.health_timeout), self.services)
+            )
+
+        # pool.map yields in configured service order regardless of completion order
         results: dict[str, dict[str, Any]] = {}
-        for svc in self.services:
-            health = probe_port(svc["port"], self.health_timeout)
+        for svc, health in zip(self.services, healths, strict=True):
             health["service_name"] = svc["name"]
             health["description"] = svc["description"]
             health["critical"] = svc.get("critical", False)
@@ -207,7 +230,7 @@ class GatewayWatchdog:
 
         # Try kickstart -k (kill + restart in one command)
         try:
-            result = subprocess.run(
+            result = self._runner(
                 ["launchctl", "kickstart", "-k", target],
                 capture_output=True,
                 text=True,
@@ -226,18 +249,18 @@ class GatewayWatchdog:
         # Fallback: bootout + bootstrap
         logger.warning("kickstart failed for %s, trying bootout+bootstrap", name)
         with contextlib.suppress(subprocess.TimeoutExpired):
-            subprocess.run(
+            self._runner(
                 ["launchctl", "bootout", target],
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
 
-        time.sleep(2)
+        self._sleeper(2)
 
         if plist_path and os.path.isfile(plist_path):
             try:
-                bootstrap = subprocess.run(
+                bootstrap = self._runner(
                     ["launchctl", "bootstrap", f"gui/{uid}", plist_path],
                     capture_output=True,
                     text=True,
@@ -317,7 +340,7 @@ class GatewayWatchdog:
                 attempts.append(restart_result)
 
                 if restart_result["success"]:
-                    time.sleep(5)
+                    self._sleeper(5)
                     verify = probe_port(svc["port"], self.health_timeout)
                     if verify["healthy"]:
                         recovered = True
@@ -333,7 +356,7 @@ class GatewayWatchdog:
                     break
 
                 if attempt < self.max_retries:
-                    time.sleep(self.retry_delay)
+                    self._sleeper(self.retry_delay)
 
             restart_results[name] = {
                 "recovered": recovered,
@@ -384,18 +407,19 @@ class GatewayWatchdog:
             "history": history,
         }
         try:
-            tmp = self._state_file + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2, default=str)
-            os.replace(tmp, self._state_file)
+            # Compact json.dumps runs on the C encoder; indent/json.dump fall back to Python
+            payload = json.dumps(state, default=str).encode("utf-8")
+            with open(self._state_tmp, "wb") as f:
+                f.write(payload)
+            os.replace(self._state_tmp, self._state_file)
         except OSError as e:
             logger.warning("Failed to save watchdog state: %s", e)
 
     def _load_history(self) -> list[dict[str, Any]]:
         """Load check history from state file."""
         try:
-            with open(self._state_file, encoding="utf-8") as f:
-                state = json.load(f)
+            with open(self._state_file, "rb") as f:
+                state = json.loads(f.read())
             history: list[dict[str, Any]] = state.get("history", [])
             return history
         except (OSError, json.JSONDecodeError):
@@ -404,19 +428,19 @@ class GatewayWatchdog:
     def get_status(self) -> dict[str, Any]:
         """Return the last watchdog state and summary stats."""
         try:
-            with open(self._state_file, encoding="utf-8") as f:
-                state = json.load(f)
+            with open(self._state_file, "rb") as f:
+                state = json.loads(f.read())
         except (OSError, json.JSONDecodeError):
             state = {"last_check": None, "history": []}
 
         history = state.get("history", [])
         total = len(history)
-        healthy_count = sum(1 for h in history if h.get("status") == "healthy")
-        down_count = sum(
-            1 for h in history if h.get("status") in ("down", "critical_down")
-        )
-        recovered_count = sum(1 for h in history if h.get("status") == "recovered")
-        degraded_count = sum(1 for h in history if h.get("status") == "degraded")
+        # Single pass over history; Counter tallies in C
+        counts = Counter(h.get("status") for h in history)
+        healthy_count = counts["healthy"]
+        down_count = sum(counts[status] for status in DOWN_STATUSES)
+        recovered_count = counts["recovered"]
+        degraded_count = counts["degraded"]
 
         return {
             "last_check": state.get("last_check"),
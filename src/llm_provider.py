@@ -1,14 +1,17 @@
-"""Anthropic API client via stdlib urllib.request.
+"""Anthropic API client via stdlib http.client.
 
 Uses claude-haiku-4-5-20251001 for cost-efficient internal analysis.
-Falls back gracefully when no API key is available.
+Keeps one keep-alive HTTPS connection per provider so repeated calls skip
+the TCP + TLS handshake. Falls back gracefully when no API key is available.
 """
 
+import http.client
 import json
 import logging
 import os
-import urllib.error
-import urllib.request
+import time
+import urllib.parse
+from functools import cached_property
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,12 @@ logger = logging.getLogger(__name__)
 API_URL = "https://api.anthropic.com/v1/messages"
 DEFAULT_MODEL = "claude-haiku-4-5-20251001"
 API_VERSION = "2023-06-01"
+API_TIMEOUT = 30  # seconds
+# Reconnect instead of reusing a connection idle longer than this; servers drop
+# idle keep-alive sockets, and the daemon's calls are hours apart
+KEEPALIVE_IDLE = 30  # seconds
+
+_API_PARTS = urllib.parse.urlsplit(API_URL)
 
 
 class LLMProvider:
@@ -25,6 +34,17 @@ class LLMProvider:
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         self.available = bool(self.api_key)
         self.model = DEFAULT_MODEL
+        self._conn: http.client.HTTPSConnection | None = None
+        self._last_used = 0.0  # time.monotonic() when _conn last finished a request
+
+    @cached_property
+    def _headers(self) -> dict[str, str]:
+        """Request headers; constant for the lifetime of the provider."""
+        return {
+            "x-api-key": self.api_key,
+            "anthropic-version": API_VERSION,
+            "content-type": "application/json",
+        }
 
     def analyze(self, prompt: str, context: str = "", max_tokens: int = 1024) -> str:
         """Send an analysis request to the Anthropic API.
@@ -49,32 +69,63 @@ class LLMProvider:
             "max_tokens": max_tokens,
             "messages": messages,
         }
-
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": API_VERSION,
-            "content-type": "application/json",
-        }
-
         body = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(API_URL, data=body, headers=headers, method="POST")
 
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                data: dict[str, Any] = json.loads(resp.read().decode("utf-8"))
-                content = data.get("content", [])
-                if content and isinstance(content, list):
-                    return str(content[0].get("text", ""))
-                return ""
-        except urllib.error.HTTPError as e:
-            logger.error("Anthropic API HTTP error %d: %s", e.code, e.reason)
+            status, reason, raw = self._post(body)
+        except (http.client.HTTPException, OSError) as e:
+            logger.error("Anthropic API connection error: %s", e)
             return ""
-        except urllib.error.URLError as e:
-            logger.error("Anthropic API URL error: %s", e.reason)
+
+        if status >= 400:
+            logger.error("Anthropic API HTTP error %d: %s", status, reason)
             return ""
-        except (json.JSONDecodeError, OSError, TimeoutError) as e:
+
+        try:
+            data: dict[str, Any] = json.loads(raw.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error("Anthropic API error: %s", e)
             return ""
+        content = data.get("content", [])
+        if content and isinstance(content, list):
+            return str(content[0].get("text", ""))
+        return ""
+
+    def _post(self, body: bytes) -> tuple[int, str, bytes]:
+        """POST over the persistent connection, reconnecting once if it went stale.
+
+        A connection idle past KEEPALIVE_IDLE is replaced before sending. Within
+        that window only RemoteDisconnected on a reused connection is retried:
+        the server closed the socket without sending a status line. Resets or
+        broken pipes may hit a request the API already received, and resending
+        that could bill it twice.
+        """
+        if self._conn is not None and time.monotonic() - self._last_used > KEEPALIVE_IDLE:
+            self.close()
+        while True:
+            reused = self._conn is not None
+            if self._conn is None:
+                self._conn = http.client.HTTPSConnection(_API_PARTS.netloc, timeout=API_TIMEOUT)
+            try:
+                self._conn.request("POST", _API_PARTS.path, body=body, headers=self._headers)
+                resp = self._conn.getresponse()
+                # Drain the body so the connection can carry the next request
+                raw = resp.read()
+                self._last_used = time.monotonic()
+                return resp.status, resp.reason, raw
+            except http.client.RemoteDisconnected:
+                self.close()
+                if not reused:
+                    raise
+            except BaseException:
+                self.close()
+                raise
+
+    def close(self) -> None:
+        """Close the pooled HTTPS connection, if one is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def format_request(
         self, messages: list[dict[str, str]], max_tokens: int = 1024
@@ -82,11 +133,7 @@ class LLMProvider:
         """Format a request payload without sending it (useful for testing)."""
         return {
             "url": API_URL,
-            "headers": {
-                "x-api-key": self.api_key,
-                "anthropic-version": API_VERSION,
-                "content-type": "application/json",
-            },
+            "headers": dict(self._headers),
             "body": {
                 "model": self.model,
                 "max_tokens": max_tokens,
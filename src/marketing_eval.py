@@ -10,6 +10,7 @@ Four loops:
   4. REPORT — generate markdown, track trends, assign grade, create GitHub issues
 """
 
+import contextlib
 import glob
 import hashlib
 import json
@@ -31,6 +32,22 @@ CHANNEL_BENCHMARKS: dict[str, dict[str, int]] = {
     "reddit": {"good": 1000, "great": 5000},
 }
 
+# Reach benchmarks for channels missing from CHANNEL_BENCHMARKS
+DEFAULT_CHANNEL_BENCHMARK: dict[str, int] = {"good": 2000, "great": 10000}
+
+# Composite weights for published content (drafts score quality only)
+COMPOSITE_WEIGHTS: dict[str, float] = {
+    "engagement_rate": 0.30,
+    "reach": 0.20,
+    "conversion": 0.20,
+    "content_quality": 0.15,
+    "freshness": 0.15,
+}
+
+# Evaluations kept in history; the JSONL log is compacted back to this many
+# entries once it reaches twice the limit
+HISTORY_LIMIT = 90
+
 # Word count range for content quality scoring
 IDEAL_WORD_COUNT = {"min": 50, "max": 500}
 
@@ -41,6 +58,18 @@ CHANNEL_PATTERNS: dict[str, list[str]] = {
     "reddit": ["reddit", "product hunt"],
 }
 
+# Markdown discovery patterns, compiled once at import
+_POST_HEADER_RE = re.compile(r"^## Post \d+:\s*(.+)", re.MULTILINE)
+_H1_RE = re.compile(r"^#\s+(.+)", re.MULTILINE)
+_LINK_RE = re.compile(r"https?://|github\.com|\[link\]")
+_CTA_RE = re.compile(
+    r"(check out|star if|share|link|repo:|full (?:story|article))", re.IGNORECASE
+)
+_HASHTAG_RE = re.compile(r"#\w+")
+
+# Bump whenever _build_content_item changes the fields it emits
+_CONTENT_SCHEMA_VERSION = 1
+
 
 class MarketingEvalEngine:
     """Evaluates marketing content effectiveness using the self-eval pattern."""
@@ -63,7 +92,9 @@ class MarketingEvalEngine:
         self.marketing_dir = marketing_dir
         os.makedirs(state_dir, exist_ok=True)
 
-        self._history_file = os.path.join(state_dir, "marketing_eval_history.json")
+        self._history_file = os.path.join(state_dir, "marketing_eval_history.jsonl")
+        # Pre-JSONL history (one JSON array); migrated on the next save
+        self._legacy_history_file = os.path.join(state_dir, "marketing_eval_history.json")
         self._content_file = os.path.join(state_dir, "marketing_content.json")
         self._hash_file = os.path.join(state_dir, "marketing_content_hashes.json")
 
@@ -88,12 +119,16 @@ class MarketingEvalEngine:
         # Load previous hashes for change detection
         previous_hashes = self._load_hashes()
         current_hashes: dict[str, str] = {}
+        parser_key = _parser_key()
 
         # Load existing content records (preserves metrics/status)
         existing_content = self._load_content()
         existing_by_id: dict[str, dict[str, Any]] = {
             c["content_id"]: c for c in existing_content
         }
+        existing_by_file: dict[str, list[dict[str, Any]]] = {}
+        for c in existing_content:
+            existing_by_file.setdefault(c.get("source_file", ""), []).append(c)
 
         all_content: list[dict[str, Any]] = []
         new_ids: list[str] = []
@@ -114,7 +149,24 @@ class MarketingEvalEngine:
                 continue
 
             rel_path = os.path.relpath(filepath, self.project_root)
-            current_hashes[rel_path] = file_hash
+            # The file entry also records which parser built its records
+            current_hashes[rel_path] = f"{file_hash}:{parser_key}"
+
+            # Unchanged file parsed by the same parser: its stored records are exactly
+            # what a re-parse would build
+            unchanged = existing_by_file.get(rel_path)
+            if (
+                unchanged
+                and previous_hashes.get(rel_path) == current_hashes[rel_path]
+                and all(
+                    "hash" in c and previous_hashes.get(c["content_id"]) == c["hash"]
+                    for c in unchanged
+                )
+            ):
+                for item in unchanged:
+                    current_hashes[item["content_id"]] = item["hash"]
+                all_content.extend(unchanged)
+                continue
 
             # Detect if this is a multi-post file or single article
             items = self._parse_content_items(filepath, rel_path, text)
@@ -171,8 +223,7 @@ class MarketingEvalEngine:
         items: list[dict[str, Any]] = []
 
         # Detect multi-post format: ## Post N: Title
-        post_pattern = re.compile(r"^## Post \d+:\s*(.+)", re.MULTILINE)
-        post_matches = list(post_pattern.finditer(text))
+        post_matches = list(_POST_HEADER_RE.finditer(text))
 
         if post_matches:
             # Multi-post file — split on headers
@@ -197,7 +248,7 @@ class MarketingEvalEngine:
             # Single content item (article)
             base_name = os.path.splitext(os.path.basename(filepath))[0]
             # Extract title from first H1
-            h1_match = re.search(r"^#\s+(.+)", text, re.MULTILINE)
+            h1_match = _H1_RE.search(text)
             title = h1_match.group(1).strip() if h1_match else base_name
             items.append(self._build_content_item(
                 content_id=base_name,
@@ -220,12 +271,9 @@ class MarketingEvalEngine:
         """Build a content item dict with detected attributes."""
         word_count = len(body.split())
         has_code_block = "```" in body
-        has_link = bool(re.search(r"https?://|github\.com|\[link\]", body))
-        has_cta = bool(re.search(
-            r"(check out|star if|share|link|repo:|full (?:story|article))",
-            body, re.IGNORECASE,
-        ))
-        hashtags = re.findall(r"#\w+", body)
+        has_link = _LINK_RE.search(body) is not None
+        has_cta = _CTA_RE.search(body) is not None
+        hashtags = _HASHTAG_RE.findall(body)
         channel = self._infer_channel(title)
         content_hash = hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
 
@@ -254,8 +302,14 @@ class MarketingEvalEngine:
 
     # ── SCORE ───────────────────────────────────────────────────────────
 
-    def score_content(self, content: dict[str, Any]) -> dict[str, Any]:
-        """Score a single content item. Returns sub-scores and composite."""
+    def score_content(
+        self, content: dict[str, Any], now: datetime | None = None
+    ) -> dict[str, Any]:
+        """Score a single content item. Returns sub-scores and composite.
+
+        ``now`` anchors the freshness score; batch callers pass one value so
+        the clock is read once per pass instead of once per item.
+        """
         metrics = content.get("metrics", {})
         is_published = content.get("status") == "published"
 
@@ -271,7 +325,7 @@ class MarketingEvalEngine:
                 "conversion": 0,
                 "content_quality": quality,
                 "freshness": 0,
-                "composite": quality * 0.15,
+                "composite": quality * COMPOSITE_WEIGHTS["content_quality"],
                 "is_draft": True,
             }
 
@@ -279,14 +333,14 @@ class MarketingEvalEngine:
         engagement = self._score_engagement_rate(metrics)
         reach = self._score_reach(metrics, content.get("channel", "unknown"))
         conversion = self._score_conversion(metrics)
-        freshness = self._score_freshness(content.get("published_date", ""))
+        freshness = self._score_freshness(content.get("published_date", ""), now)
 
         composite = (
-            engagement * 0.30
-            + reach * 0.20
-            + conversion * 0.20
-            + quality * 0.15
-            + freshness * 0.15
+            engagement * COMPOSITE_WEIGHTS["engagement_rate"]
+            + reach * COMPOSITE_WEIGHTS["reach"]
+            + conversion * COMPOSITE_WEIGHTS["conversion"]
+            + quality * COMPOSITE_WEIGHTS["content_quality"]
+            + freshness * COMPOSITE_WEIGHTS["freshness"]
         )
 
         return {
@@ -300,7 +354,8 @@ class MarketingEvalEngine:
             "is_draft": False,
         }
 
-    def _score_engagement_rate(self, metrics: dict[str, Any]) -> float:
+    @staticmethod
+    def _score_engagement_rate(metrics: dict[str, Any]) -> float:
         """engagements / impressions * 1000, capped at 100."""
         impressions: int = int(metrics.get("impressions", 0))
         engagements: int = int(metrics.get("engagements", 0))
@@ -308,10 +363,11 @@ class MarketingEvalEngine:
             return 0.0
         return min(100.0, engagements / impressions * 1000)
 
-    def _score_reach(self, metrics: dict[str, Any], channel: str) -> float:
+    @staticmethod
+    def _score_reach(metrics: dict[str, Any], channel: str) -> float:
         """Impressions normalized against channel benchmarks."""
         impressions: int = int(metrics.get("impressions", 0))
-        benchmarks = CHANNEL_BENCHMARKS.get(channel, {"good": 2000, "great": 10000})
+        benchmarks = CHANNEL_BENCHMARKS.get(channel, DEFAULT_CHANNEL_BENCHMARK)
         good = benchmarks["good"]
         great = benchmarks["great"]
         if impressions <= 0:
@@ -322,7 +378,8 @@ class MarketingEvalEngine:
             return 50.0 + 50.0 * (impressions - good) / max(1, great - good)
         return 50.0 * impressions / max(1, good)
 
-    def _score_conversion(self, metrics: dict[str, Any]) -> float:
+    @staticmethod
+    def _score_conversion(metrics: dict[str, Any]) -> float:
         """(clicks + conversions) / engagements * 200, capped at 100."""
         engagements: int = int(metrics.get("engagements", 0))
         clicks: int = int(metrics.get("clicks", 0))
@@ -331,7 +388,8 @@ class MarketingEvalEngine:
             return 0.0
         return min(100.0, (clicks + conversions) / engagements * 200)
 
-    def _score_content_quality(self, content: dict[str, Any]) -> float:
+    @staticmethod
+    def _score_content_quality(content: dict[str, Any]) -> float:
         """Rule-based quality score: 20 pts each for 5 attributes."""
         score = 0.0
         wc = content.get("word_count", 0)
@@ -347,13 +405,21 @@ class MarketingEvalEngine:
             score += 20
         return score
 
-    def _score_freshness(self, published_date: str) -> float:
-        """max(0, 100 - days_since_published * 2)."""
+    @staticmethod
+    def _score_freshness(published_date: str | datetime, now: datetime | None = None) -> float:
+        """max(0, 100 - days_since_published * 2).
+
+        Accepts an already-parsed datetime to skip the ISO string round trip.
+        """
         if not published_date:
             return 0.0
         try:
-            pub = datetime.fromisoformat(published_date.replace("Z", "+00:00"))
-            now = datetime.now(timezone.utc)
+            if isinstance(published_date, datetime):
+                pub = published_date
+            else:
+                pub = datetime.fromisoformat(published_date.replace("Z", "+00:00"))
+            if now is None:
+                now = datetime.now(timezone.utc)
             days = (now - pub).days
             return max(0.0, 100.0 - days * 2)
         except (ValueError, TypeError):
@@ -365,8 +431,9 @@ class MarketingEvalEngine:
         scores: list[dict[str, Any]] = []
         published_scores: list[float] = []
 
+        now = datetime.now(timezone.utc)
         for content in content_list:
-            s = self.score_content(content)
+            s = self.score_content(content, now)
             scores.append(s)
             if not s["is_draft"]:
                 published_scores.append(s["composite"])
@@ -389,7 +456,8 @@ class MarketingEvalEngine:
             "draft_count": len(scores) - len(published_scores),
         }
 
-    def _score_to_grade(self, score: float) -> str:
+    @staticmethod
+    def _score_to_grade(score: float) -> str:
         """Convert composite score to letter grade."""
         for grade, threshold in GRADE_THRESHOLDS.items():
             if score >= threshold:
@@ -832,27 +900,59 @@ class MarketingEvalEngine:
         return history[-1] if history else None
 
     def _load_history(self) -> list[dict[str, Any]]:
-        """Load evaluation history."""
+        """Load evaluation history (the most recent HISTORY_LIMIT entries)."""
+        return self._read_history()[-HISTORY_LIMIT:]
+
+    def _read_history(self) -> list[dict[str, Any]]:
+        """Every entry currently in the history log, oldest first."""
+        try:
+            with open(self._history_file, "rb") as f:
+                return _decode_history(f.read())
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return []
         try:
-            with open(self._history_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json(self._legacy_history_file)
             return data if isinstance(data, list) else []
         except (OSError, json.JSONDecodeError):
             return []
 
     def _save_eval(self, report: dict[str, Any]) -> None:
-        """Append evaluation to history (capped at 90 entries)."""
-        history = self._load_history()
-        history.append(report)
-        history = history[-90:]
+        """Append evaluation to history (capped at HISTORY_LIMIT entries).
+
+        A save appends one line; the log is only rewritten when it first
+        appears (migrating any legacy JSON history) or when it has grown to
+        twice the limit, so the amortized write cost is one entry. Each save
+        still reads the log (at most 2 * HISTORY_LIMIT lines) to check the cap.
+        """
+        line = _dumps(report)
+        entries = self._read_history()
+        if not os.path.exists(self._history_file) or len(entries) >= 2 * HISTORY_LIMIT - 1:
+            self._rewrite_history([*entries, json.loads(line)][-HISTORY_LIMIT:])
+            return
         try:
-            tmp = self._history_file + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(history, f, indent=2, default=str)
-            os.replace(tmp, self._history_file)
+            with open(self._history_file, "ab+") as f:
+                # Start on a fresh line if a crashed save left a torn one behind
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line + b"\n")
         except OSError as e:
             logger.warning("Failed to save marketing eval history: %s", e)
 
+    def _rewrite_history(self, entries: list[dict[str, Any]]) -> None:
+        """Atomically replace the history log with ``entries``."""
+        payload = b"".join(_dumps(entry) + b"\n" for entry in entries)
+        try:
+            self._write_atomic(self._history_file, payload)
+        except OSError as e:
+            logger.warning("Failed to save marketing eval history: %s", e)
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._legacy_history_file)
+
     def get_trend_summary(self) -> dict[str, Any]:
         """Summarize trends from evaluation history."""
         history = self._load_history()
@@ -874,8 +974,7 @@ class MarketingEvalEngine:
     def _load_content(self) -> list[dict[str, Any]]:
         """Load content records from state."""
         try:
-            with open(self._content_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json(self._content_file)
             return data if isinstance(data, list) else []
         except (OSError, json.JSONDecodeError):
             return []
@@ -883,18 +982,14 @@ class MarketingEvalEngine:
     def _save_content(self, content: list[dict[str, Any]]) -> None:
         """Save content records to state."""
         try:
-            tmp = self._content_file + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(content, f, indent=2, default=str)
-            os.replace(tmp, self._content_file)
+            self._write_atomic(self._content_file, _dumps(content))
         except OSError as e:
             logger.warning("Failed to save marketing content: %s", e)
 
     def _load_hashes(self) -> dict[str, str]:
         """Load content hashes for change detection."""
         try:
-            with open(self._hash_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json(self._hash_file)
             return data if isinstance(data, dict) else {}
         except (OSError, json.JSONDecodeError):
             return {}
@@ -902,9 +997,57 @@ class MarketingEvalEngine:
     def _save_hashes(self, hashes: dict[str, str]) -> None:
         """Save content hashes."""
         try:
-            tmp = self._hash_file + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(hashes, f, indent=2)
-            os.replace(tmp, self._hash_file)
+            self._write_atomic(self._hash_file, _dumps(hashes))
         except OSError as e:
             logger.warning("Failed to save marketing content hashes: %s", e)
+
+    @staticmethod
+    def _write_atomic(path: str, payload: bytes) -> None:
+        """Write ``payload`` to a temp file in one call, then swap it into place."""
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        """Read and parse a JSON state file."""
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize state as compact UTF-8 JSON.
+
+    Compact json.dumps runs on the C encoder; indent/json.dump fall back to Python.
+    """
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _parser_key() -> str:
+    """Fingerprint of everything _build_content_item derives attributes from.
+
+    Computed per discovery because CHANNEL_PATTERNS may be edited at runtime.
+    """
+    spec = [
+        _CONTENT_SCHEMA_VERSION,
+        CHANNEL_PATTERNS,
+        [rx.pattern for rx in (_POST_HEADER_RE, _H1_RE, _LINK_RE, _CTA_RE, _HASHTAG_RE)],
+    ]
+    return hashlib.sha256(_dumps(spec)).hexdigest()[:16]
+
+
+def _decode_history(raw: bytes) -> list[dict[str, Any]]:
+    """Parse a JSONL history log, skipping blank or torn lines."""
+    entries: list[dict[str, Any]] = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning("Skipping unreadable marketing eval history line")
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
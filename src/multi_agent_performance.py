@@ -1,8 +1,9 @@
 """Multi-agent performance optimizer: tracks, scores, and escalates agent performance."""
 
+import heapq
 import logging
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -33,9 +34,22 @@ class MultiAgentPerformanceOptimizer:
         :param agent_details: Dictionary containing agent information
         :return: Unique agent ID
         """
+        return self._register(agent_details, datetime.now().isoformat())
+
+    def register_agents(self, agents: Iterable[dict[str, Any]]) -> list[str]:
+        """
+        Register several agents in one call, sharing a single registration timestamp
+
+        :param agents: Iterable of agent detail dictionaries
+        :return: Unique agent IDs, in input order
+        """
+        now = datetime.now().isoformat()
+        return [self._register(agent_details, now) for agent_details in agents]
+
+    def _register(self, agent_details: dict[str, Any], timestamp: str) -> str:
         agent_id = str(uuid.uuid4())
         agent_details["id"] = agent_id
-        agent_details["registration_time"] = datetime.now().isoformat()
+        agent_details["registration_time"] = timestamp
         agent_details["performance_score"] = 0.0
 
         self.agents[agent_id] = agent_details
@@ -51,17 +65,46 @@ class MultiAgentPerformanceOptimizer:
         if agent_id not in self.agents:
             raise ValueError(f"Agent {agent_id} not registered")
 
+        self._apply_performance(agent_id, performance_data, datetime.now().isoformat())
+
+    def update_performance_many(
+        self, agent_ids: Sequence[str], performance_data: Sequence[dict[str, Any]]
+    ) -> None:
+        """
+        Update performance metrics for several agents in one call
+
+        All IDs are validated before any agent is touched, so an unknown ID
+        leaves every agent unchanged.
+
+        :param agent_ids: Unique identifiers for the agents
+        :param performance_data: Performance metrics, one dictionary per agent ID
+        """
+        if len(agent_ids) != len(performance_data):
+            raise ValueError(
+                f"Got {len(agent_ids)} agent IDs but {len(performance_data)} performance entries"
+            )
+        for agent_id in agent_ids:
+            if agent_id not in self.agents:
+                raise ValueError(f"Agent {agent_id} not registered")
+
+        now = datetime.now().isoformat()
+        for agent_id, data in zip(agent_ids, performance_data, strict=True):
+            self._apply_performance(agent_id, data, now)
+
+    def _apply_performance(
+        self, agent_id: str, performance_data: dict[str, Any], timestamp: str
+    ) -> None:
         # Calculate performance score
         performance_score = self._calculate_performance_score(performance_data)
 
         # Update agent record
-        self.agents[agent_id]["last_performance_update"] = datetime.now().isoformat()
+        self.agents[agent_id]["last_performance_update"] = timestamp
         self.agents[agent_id]["performance_score"] = performance_score
 
         # Log performance history
         performance_log = {
             "agent_id": agent_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "performance_data": performance_data,
             "performance_score": performance_score,
         }
@@ -123,10 +166,8 @@ class MultiAgentPerformanceOptimizer:
         :param n: Number of top agents to return
         :return: List of top performing agents
         """
-        sorted_agents = sorted(
-            self.agents.values(), key=lambda x: x.get("performance_score", 0), reverse=True
-        )
-        return sorted_agents[:n]
+        # Partial selection, O(N log n); same order (ties included) as a full sort
+        return heapq.nlargest(n, self.agents.values(), key=lambda x: x.get("performance_score", 0))
 
     def generate_performance_report(self, time_window: int = 30) -> dict[str, Any]:
         """
@@ -4,12 +4,14 @@ Provides state persistence, idle checking, daily review, daemon mode,
 multi-agent support, and monitoring config integration.
 """
 
+import contextlib
 import json
 import logging
 import os
 import signal
 import time
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
 from anti_idling_system import AntiIdlingSystem
@@ -23,6 +25,20 @@ from results_verification import ResultsVerificationFramework
 
 logger = logging.getLogger(__name__)
 
+# idle_check and status reuse one round of service probes for this long
+SERVICE_HEALTH_TTL = 5.0  # seconds
+
+# Scanner fields too bulky for the persisted activity log (e.g. a reflection's full
+# parsed sections); anti-idling only reads type, duration and is_productive
+_UNLOGGED_ACTIVITY_KEYS = frozenset({"parsed"})
+
+
+def _log_entry(activity: dict[str, Any]) -> dict[str, Any]:
+    """Scanner activity minus the fields the activity log doesn't keep."""
+    if _UNLOGGED_ACTIVITY_KEYS.isdisjoint(activity):
+        return activity
+    return {k: v for k, v in activity.items() if k not in _UNLOGGED_ACTIVITY_KEYS}
+
 
 class StateManager:
     """JSON-file-based state persistence."""
@@ -30,28 +46,59 @@ class StateManager:
     def __init__(self, state_dir: str) -> None:
         self.state_dir = state_dir
         os.makedirs(state_dir, exist_ok=True)
+        # key -> (payload, (inode, mtime_ns, size)) of the last file this manager wrote
+        self._written: dict[str, tuple[bytes, tuple[int, int, int]]] = {}
 
     def save(self, key: str, data: Any) -> None:
-        """Save data to a JSON file."""
+        """Save data to a JSON file.
+
+        Skips the rewrite when the payload matches the last save and the file
+        on disk is still the one written then.
+        """
         filepath = os.path.join(self.state_dir, f"{key}.json")
+        # Compact json.dumps runs on the C encoder; indent/json.dump fall back to Python
+        payload = json.dumps(data, default=str).encode("utf-8")
+        last = self._written.get(key)
+        if last is not None and last[0] == payload:
+            try:
+                if _file_signature(filepath) == last[1]:
+                    return
+            except OSError:
+                pass
+
+        # Write a sibling temp file and rename it over the target: a crash mid-write
+        # leaves the previous state intact instead of a truncated JSON file
         tmp = filepath + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
-        os.replace(tmp, filepath)
+        try:
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, filepath)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+            raise
+        self._written[key] = (payload, _file_signature(filepath))
 
     def load(self, key: str, default: Any = None) -> Any:
         """Load data from a JSON file. Returns default if missing."""
         filepath = os.path.join(self.state_dir, f"{key}.json")
-        if not os.path.isfile(filepath):
-            return default
         try:
-            with open(filepath, encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            # One open() instead of stat + open; a missing file is the common miss
+            with open(filepath, "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return default
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
             logger.warning("Failed to load state %s: %s", key, e)
             return default
 
 
+def _file_signature(path: str) -> tuple[int, int, int]:
+    """(inode, mtime_ns, size): changes whenever the file is replaced or edited."""
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
 class SelfOptimizationOrchestrator:
     """Integration layer wiring all 4 self-optimization systems."""
 
@@ -85,18 +132,18 @@ class SelfOptimizationOrchestrator:
         # State persistence
         self.state = StateManager(state_dir)
 
-        # Create all 4 systems
+        # Anti-idling and performance are wired up below; the improvement and
+        # verification systems, scanner and LLM are cached properties built on first
+        # use. _restore_state/_persist_state read improvement, so in practice it is
+        # built on every run; the others wait for a command that needs them
         self.anti_idling = AntiIdlingSystem(
             idle_threshold=idle_threshold, minimum_productive_actions=10
         )
         self.performance = MultiAgentPerformanceOptimizer(quality_threshold=quality_threshold)
-        self.improvement = RecursiveSelfImprovementProtocol()
-        self.verification = ResultsVerificationFramework()
 
-        # Scanner, LLM, and gateway watchdog
-        self.scanner = FilesystemScanner(workspace_dir=workspace_dir)
-        self.llm = LLMProvider()
+        # Gateway watchdog; probe results are cached briefly (see _service_health)
         self.watchdog = GatewayWatchdog(state_dir=state_dir)
+        self._health_cache: tuple[float, dict[str, dict[str, Any]]] | None = None
 
         # Register all agents from config (or just the current one)
         self._agent_ids: dict[str, str] = {}  # agent_name -> internal perf ID
@@ -136,6 +183,26 @@ class SelfOptimizationOrchestrator:
         # Restore persisted state
         self._restore_state()
 
+    @cached_property
+    def improvement(self) -> RecursiveSelfImprovementProtocol:
+        """Recursive self-improvement protocol, built on first access."""
+        return RecursiveSelfImprovementProtocol()
+
+    @cached_property
+    def verification(self) -> ResultsVerificationFramework:
+        """Results verification framework, built on first access."""
+        return ResultsVerificationFramework()
+
+    @cached_property
+    def scanner(self) -> FilesystemScanner:
+        """Workspace activity scanner, built on first access."""
+        return FilesystemScanner(workspace_dir=self.workspace_dir)
+
+    @cached_property
+    def llm(self) -> LLMProvider:
+        """Anthropic API client, built on first access."""
+        return LLMProvider()
+
     def idle_check(self) -> dict[str, Any]:
         """Run an idle check: scan filesystem, assess idle rate, take action if needed.
 
@@ -154,7 +221,7 @@ class SelfOptimizationOrchestrator:
         }
 
         # 0. Check service health (gateway, enterprise, vite-ui)
-        service_health = self.watchdog.check_all_services()
+        service_health = self._service_health()
         result["service_health"] = service_health
         down_services = [
             name for name, h in service_health.items()
@@ -173,7 +240,7 @@ class SelfOptimizationOrchestrator:
 
         # 2. Feed activities into anti-idling system
         for activity in activities:
-            self.anti_idling.log_activity(activity)
+            self.anti_idling.log_activity(_log_entry(activity))
 
         # 3. Calculate idle rate from real data
         idle_rate = self.anti_idling.calculate_idle_rate(time_window=7200)
@@ -231,7 +298,7 @@ class SelfOptimizationOrchestrator:
         # 2. Feed activities into systems
         productive_count = 0
         for activity in activities:
-            self.anti_idling.log_activity(activity)
+            self.anti_idling.log_activity(_log_entry(activity))
             if activity.get("is_productive", False):
                 productive_count += 1
 
@@ -330,27 +397,36 @@ class SelfOptimizationOrchestrator:
         signal.signal(signal.SIGTERM, _handle_sigterm)
         logger.info("Daemon started: idle every %ds, review at hour %d", idle_interval, review_hour)
 
-        while self._daemon_running:
-            try:
-                # Idle check
-                self.idle_check()
+        try:
+            while self._daemon_running:
+                try:
+                    # Idle check
+                    self.idle_check()
 
-                # Daily review (once per day at the specified hour)
-                now = datetime.now()
-                today = now.strftime("%Y-%m-%d")
-                if now.hour >= review_hour and last_review_date != today:
-                    self.daily_review()
-                    last_review_date = today
+                    # Daily review (once per day at the specified hour)
+                    now = datetime.now()
+                    today = now.strftime("%Y-%m-%d")
+                    if now.hour >= review_hour and last_review_date != today:
+                        self.daily_review()
+                        last_review_date = today
 
-            except Exception as e:
-                logger.error("Daemon cycle error: %s", e)
+                except Exception as e:
+                    logger.error("Daemon cycle error: %s", e)
 
-            time.sleep(idle_interval)
+                time.sleep(idle_interval)
+        finally:
+            self.close()
 
     def stop_daemon(self) -> None:
         """Stop the daemon loop."""
         self._daemon_running = False
 
+    def close(self) -> None:
+        """Release the LLM provider's pooled connection, if the provider was built."""
+        llm = self.__dict__.get("llm")
+        if llm is not None:
+            llm.close()
+
     def log_activity(self, activity: dict[str, Any]) -> None:
         """External API for bots to log activities explicitly."""
         self.anti_idling.log_activity(activity)
@@ -358,7 +434,7 @@ class SelfOptimizationOrchestrator:
     def status(self) -> dict[str, Any]:
         """Return current system status including service health."""
         last_run = self.state.load("last_run", {})
-        service_health = self.watchdog.check_all_services()
+        service_health = self._service_health()
         return {
             "agent_id": self.agent_id,
             "workspace_dir": self.workspace_dir,
@@ -378,6 +454,17 @@ class SelfOptimizationOrchestrator:
             },
         }
 
+    def _service_health(self) -> dict[str, dict[str, Any]]:
+        """Probe all services, reusing results younger than SERVICE_HEALTH_TTL."""
+        now = time.monotonic()
+        if self._health_cache is not None:
+            expires_at, health = self._health_cache
+            if now < expires_at:
+                return dict(health)
+        health = self.watchdog.check_all_services()
+        self._health_cache = (now + SERVICE_HEALTH_TTL, health)
+        return dict(health)
+
     def get_intervention_tier(self, agent_name: str = "") -> dict[str, Any]:
         """Determine intervention tier for an agent based on config thresholds.
 
@@ -797,7 +884,7 @@ class SelfOptimizationOrchestrator:
 
     def _persist_state(self) -> None:
         """Save system state to disk."""
-        self.state.save("activity_log", self.anti_idling.activity_log)
+        self.state.save("activity_log", list(self.anti_idling.activity_log))
         self.state.save("performance_history", self.performance.performance_history)
         self.state.save("improvement_history", self.improvement.improvement_history)
         self.state.save("capability_map", self.improvement.capability_map)
@@ -806,7 +893,8 @@ class SelfOptimizationOrchestrator:
         """Restore system state from disk."""
         activity_log = self.state.load("activity_log")
         if isinstance(activity_log, list):
-            self.anti_idling.activity_log = activity_log
+            self.anti_idling.activity_log.clear()
+            self.anti_idling.activity_log.extend(activity_log)
 
         perf_history = self.state.load("performance_history")
         if isinstance(perf_history, list):
@@ -1,4 +1,5 @@
 import logging
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
@@ -39,11 +40,14 @@ class RecursiveSelfImprovementProtocol:
 
         :param new_capabilities: Dictionary of new or updated capabilities
         """
-        for capability, details in new_capabilities.items():
-            self.capability_map[capability] = {
-                "added_timestamp": datetime.now().isoformat(),
-                **details,
+        # One clock read for the whole batch; entries may still override the timestamp
+        now = datetime.now().isoformat()
+        self.capability_map.update(
+            {
+                capability: {"added_timestamp": now, **details}
+                for capability, details in new_capabilities.items()
             }
+        )
 
         self._log_improvement("capability_update", new_capabilities)
 
@@ -142,11 +146,18 @@ class RecursiveSelfImprovementProtocol:
         :param proposal: Improvement proposal to validate
         :return: Whether the proposal passes ethical validation
         """
-        # Check against each ethical constraint
-        for constraint, required in self.ethical_constraints.items():
-            if not proposal.get(f"meets_{constraint}", False) and required:
-                self.logger.warning(f"Proposal failed {constraint} constraint")
-                return False
+        # Read the live constraints on every call; stops at the first one not met
+        failed = next(
+            (
+                constraint
+                for constraint, required in self.ethical_constraints.items()
+                if required and not proposal.get(f"meets_{constraint}", False)
+            ),
+            None,
+        )
+        if failed is not None:
+            self.logger.warning(f"Proposal failed {failed} constraint")
+            return False
 
         return True
 
@@ -244,20 +255,13 @@ class RecursiveSelfImprovementProtocol:
             if datetime.fromisoformat(log["timestamp"]) > cutoff_date
         ]
 
-        improvement_types: dict[str, int] = {}
-        report: dict[str, Any] = {
+        return {
             "total_improvements": len(recent_improvements),
-            "improvement_types": improvement_types,
+            # Counter tallies in C; dict() keeps the plain first-seen-order mapping
+            "improvement_types": dict(Counter(log["type"] for log in recent_improvements)),
             "capability_growth": self._analyze_capability_growth(recent_improvements),
         }
 
-        # Aggregate improvement types
-        for log in recent_improvements:
-            imp_type = log["type"]
-            improvement_types[imp_type] = improvement_types.get(imp_type, 0) + 1
-
-        return report
-
     def _analyze_capability_growth(self, improvements: list[dict[str, Any]]) -> dict[str, Any]:
         """
         Analyze capability growth from recent improvements.
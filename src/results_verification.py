@@ -1,6 +1,7 @@
 import json
 import logging
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from typing import Any
 
@@ -12,6 +13,8 @@ class ResultsVerificationFramework:
 
         :param max_history: Maximum number of verification history entries (FIFO pruning)
         """
+        if max_history < 1:
+            raise ValueError(f"max_history must be >= 1, got {max_history}")
         self.verification_criteria = {
             "specific": self._check_specificity,
             "measurable": self._check_measurability,
@@ -20,11 +23,21 @@ class ResultsVerificationFramework:
             "compoundable": self._check_compoundability,
         }
 
-        self.verification_history: list[dict[str, Any]] = []
         self.max_history = max_history
+        self.verification_history = []
 
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def verification_history(self) -> deque[dict[str, Any]]:
+        return self._verification_history
+
+    @verification_history.setter
+    def verification_history(self, history: Iterable[dict[str, Any]]) -> None:
+        # FIFO pruning (Bug #10 fix): any assigned history is re-wrapped in a deque
+        # that drops the oldest entry past max_history
+        self._verification_history = deque(history, maxlen=self.max_history)
+
     def add_custom_verification_criterion(self, name: str, verification_func: Callable) -> None:
         """
         Add a custom verification criterion
@@ -50,6 +63,7 @@ class ResultsVerificationFramework:
         if not isinstance(results, dict):
             raise TypeError(f"results must be a dict, got {type(results).__name__}")
         verification_results = {}
+        # Built-in checks are staticmethods: plain function calls, no bound-method hop
         for criterion, check_func in self.verification_criteria.items():
             try:
                 verification_results[criterion] = check_func(results)
@@ -66,13 +80,10 @@ class ResultsVerificationFramework:
         }
         self.verification_history.append(verification_log)
 
-        # FIFO pruning (Bug #10 fix)
-        if len(self.verification_history) > self.max_history:
-            self.verification_history = self.verification_history[-self.max_history :]
-
         return verification_results
 
-    def _check_specificity(self, results: dict[str, Any]) -> bool:
+    @staticmethod
+    def _check_specificity(results: dict[str, Any]) -> bool:
         """
         Check if results are specific and well-defined
 
@@ -86,7 +97,8 @@ class ResultsVerificationFramework:
             and all(value is not None for value in results.values())
         )
 
-    def _check_measurability(self, results: dict[str, Any]) -> bool:
+    @staticmethod
+    def _check_measurability(results: dict[str, Any]) -> bool:
         """
         Check if results can be quantitatively measured
 
@@ -97,7 +109,8 @@ class ResultsVerificationFramework:
             return False
         return any(isinstance(value, (int, float, str)) for value in results.values())
 
-    def _check_actionability(self, results: dict[str, Any]) -> bool:
+    @staticmethod
+    def _check_actionability(results: dict[str, Any]) -> bool:
         """
         Check if results can be immediately acted upon
 
@@ -106,7 +119,8 @@ class ResultsVerificationFramework:
         """
         return "next_step" in results or "recommendation" in results
 
-    def _check_reusability(self, results: dict[str, Any]) -> bool:
+    @staticmethod
+    def _check_reusability(results: dict[str, Any]) -> bool:
         """
         Check if results can be applied to other contexts
 
@@ -115,7 +129,8 @@ class ResultsVerificationFramework:
         """
         return len(results) > 1  # Multiple applicable insights
 
-    def _check_compoundability(self, results: dict[str, Any]) -> bool:
+    @staticmethod
+    def _check_compoundability(results: dict[str, Any]) -> bool:
         """
         Check if results can generate further insights
 
@@ -130,8 +145,11 @@ class ResultsVerificationFramework:
 
         :param filename: Name of the file to export
         """
-        with open(filename, "w") as f:
-            json.dump(self.verification_history, f, indent=2)
+        # One-shot compact dumps runs on the C encoder (json.dump and indent= fall back
+        # to pure Python); serializing first also leaves the file untouched on error
+        payload = json.dumps(list(self.verification_history)).encode("utf-8")
+        with open(filename, "wb") as f:
+            f.write(payload)
 
         self.logger.info(f"Verification history exported to {filename}")
 
@@ -144,6 +162,7 @@ class ResultsVerificationFramework:
         if not self.verification_history:
             return 0.0
 
+        # Scan the history itself (bounded by max_history) so direct appends are counted
         successful_verifications = sum(
             1 for log in self.verification_history if log["overall_valid"]
         )
@@ -387,7 +387,8 @@ class SelfEvalEngine:
 
         return report
 
-    def _score_to_grade(self, score: float) -> str:
+    @staticmethod
+    def _score_to_grade(score: float) -> str:
         """Convert composite score to letter grade."""
         for grade, threshold in GRADE_THRESHOLDS.items():
             if score >= threshold:
@@ -544,8 +545,12 @@ class SelfEvalEngine:
 
     def _save_eval(self, report: dict[str, Any]) -> None:
         """Append evaluation to history (capped at 90 entries ≈ 3 months daily)."""
+        self._save_eval_batch([report])
+
+    def _save_eval_batch(self, reports: list[dict[str, Any]]) -> None:
+        """Append several evaluations with a single history read and write."""
         history = self._load_history()
-        history.append(report)
+        history.extend(reports)
         history = history[-90:]
         try:
             tmp = self._history_file + ".tmp"
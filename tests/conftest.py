@@ -1,5 +1,77 @@
+import glob
 import os
+import shutil
 import sys
 
+import pytest
+
 # Add src/ to path so tests can import modules directly
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from results_verification import ResultsVerificationFramework  # noqa: E402
+
+_TMPFS = "/dev/shm"
+# Set only when pytest_configure picked the tmpfs basetemp itself
+_TMPFS_BASETEMP = pytest.StashKey[str]()
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Root tmp_path dirs on tmpfs when the host has one, so state-file writes stay in memory.
+
+    An explicit --basetemp wins; xdist workers inherit the controller's basetemp.
+    """
+    if config.option.basetemp is not None:
+        return
+    if not (os.path.isdir(_TMPFS) and os.access(_TMPFS, os.W_OK)):
+        return
+    # pytest wipes --basetemp on startup, so every run gets its own directory. A
+    # failed run's directory is kept until the next run starts (retention count 1).
+    prefix = os.path.join(_TMPFS, f"pytest-{os.getuid()}-")
+    for earlier in glob.glob(prefix + "*"):
+        pid = earlier[len(prefix) :]
+        if pid.isdigit() and not _pid_alive(int(pid)):
+            shutil.rmtree(earlier, ignore_errors=True)
+    config.option.basetemp = f"{prefix}{os.getpid()}"
+    config.stash[_TMPFS_BASETEMP] = config.option.basetemp
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Free the tmpfs basetemp after a clean run; it lives in RAM.
+
+    After a failure it is kept so the failed tests' tmp_path dirs can be
+    inspected; tmp_path_retention_policy has already removed the passed ones.
+    """
+    basetemp = session.config.stash.get(_TMPFS_BASETEMP, None)
+    if basetemp is not None and exitstatus == 0:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _offline_llm():
+    """Keep the suite offline: without an API key every LLMProvider() reports unavailable."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("ANTHROPIC_API_KEY", raising=False)
+        yield
+
+
+@pytest.fixture(scope="module")
+def fw_ro():
+    """Shared framework for tests that never add criteria or record history."""
+    return ResultsVerificationFramework()
+
+
+@pytest.fixture()
+def fw_rw():
+    """Fresh framework for tests that verify, add criteria or replace history."""
+    return ResultsVerificationFramework()
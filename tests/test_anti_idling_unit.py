@@ -20,7 +20,8 @@ class TestAntiIdlingInit:
         system = AntiIdlingSystem()
         assert system.idle_threshold == 0.10
         assert system.minimum_productive_actions == 10
-        assert system.activity_log == []
+        assert list(system.activity_log) == []
+        assert system.activity_log.maxlen == 100
         assert system.intervention_callbacks == []
 
     def test_custom_parameters(self):
@@ -67,34 +67,29 @@ class TestAntiIdlingAdversarialInputs:
 
 
 class TestVerificationAdversarialInputs:
-    def test_verify_none_raises(self):
+    def test_verify_none_raises(self, fw_ro):
         """Passing None raises TypeError."""
-        fw = ResultsVerificationFramework()
         with pytest.raises(TypeError):
-            fw.verify_results(None)
+            fw_ro.verify_results(None)
 
-    def test_verify_non_dict_raises(self):
+    def test_verify_non_dict_raises(self, fw_ro):
         """Passing a list raises TypeError."""
-        fw = ResultsVerificationFramework()
         with pytest.raises(TypeError):
-            fw.verify_results([1, 2, 3])
+            fw_ro.verify_results([1, 2, 3])
 
-    def test_verify_nested_deeply(self):
-        fw = ResultsVerificationFramework()
+    def test_verify_nested_deeply(self, fw_rw):
         deep = {"level1": {"level2": {"level3": {"level4": "value"}}}}
-        v = fw.verify_results(deep)
+        v = fw_rw.verify_results(deep)
         assert v["compoundable"] is True  # has dict value
         assert v["measurable"] is False  # only dict value, no scalar
 
-    def test_verify_with_special_characters(self):
-        fw = ResultsVerificationFramework()
-        v = fw.verify_results({"key\n\t": "value\x00", "other": 42})
+    def test_verify_with_special_characters(self, fw_rw):
+        v = fw_rw.verify_results({"key\n\t": "value\x00", "other": 42})
         assert v["specific"] is True
 
-    def test_verify_with_very_large_dict(self):
-        fw = ResultsVerificationFramework()
+    def test_verify_with_very_large_dict(self, fw_rw):
         large = {f"key_{i}": i for i in range(10000)}
-        v = fw.verify_results(large)
+        v = fw_rw.verify_results(large)
         assert v["specific"] is True  # zero is accepted now (value is not None)
         assert v["reusable"] is True
         assert v["measurable"] is True
@@ -126,23 +121,19 @@ class TestBoundaryConditions:
             ais.log_activity({"type": f"action_{i}"})
         assert len(ais.activity_log) == 100
 
-    def test_single_key_reusability(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_reusability({"single": 1}) is False
+    def test_single_key_reusability(self, fw_ro):
+        assert fw_ro._check_reusability({"single": 1}) is False
 
-    def test_two_keys_reusability(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_reusability({"a": 1, "b": 2}) is True
+    def test_two_keys_reusability(self, fw_ro):
+        assert fw_ro._check_reusability({"a": 1, "b": 2}) is True
 
-    def test_success_rate_single_success(self):
-        fw = ResultsVerificationFramework()
-        fw.verification_history = [{"overall_valid": True}]
-        assert fw.get_verification_success_rate() == 100.0
+    def test_success_rate_single_success(self, fw_rw):
+        fw_rw.verification_history = [{"overall_valid": True}]
+        assert fw_rw.get_verification_success_rate() == 100.0
 
-    def test_success_rate_single_failure(self):
-        fw = ResultsVerificationFramework()
-        fw.verification_history = [{"overall_valid": False}]
-        assert fw.get_verification_success_rate() == 0.0
+    def test_success_rate_single_failure(self, fw_rw):
+        fw_rw.verification_history = [{"overall_valid": False}]
+        assert fw_rw.get_verification_success_rate() == 0.0
 
 
 # ── Thread Safety ────────────────────────────────────────────────────────
@@ -175,14 +166,13 @@ class TestThreadSafety:
         assert len(errors) == 0
         assert len(ais.activity_log) <= 100
 
-    def test_concurrent_verification(self):
-        fw = ResultsVerificationFramework()
+    def test_concurrent_verification(self, fw_rw):
         errors = []
 
         def verify_batch(batch_id):
             try:
                 for i in range(20):
-                    fw.verify_results({f"key_{batch_id}_{i}": i, "b": 1})
+                    fw_rw.verify_results({f"key_{batch_id}_{i}": i, "b": 1})
             except Exception as e:
                 errors.append(e)
 
@@ -232,15 +222,13 @@ class TestAPIMisuse:
         ais.detect_and_interrupt_idle_state()
         callback.assert_called_once()
 
-    def test_export_before_any_verification(self, tmp_path):
-        fw = ResultsVerificationFramework()
+    def test_export_before_any_verification(self, fw_ro, tmp_path):
         filepath = str(tmp_path / "empty.json")
-        fw.export_verification_history(filepath)
+        fw_ro.export_verification_history(filepath)
         import json
 
         with open(filepath) as f:
             assert json.load(f) == []
 
-    def test_success_rate_before_any_verification(self):
-        fw = ResultsVerificationFramework()
-        assert fw.get_verification_success_rate() == 0.0
+    def test_success_rate_before_any_verification(self, fw_ro):
+        assert fw_ro.get_verification_success_rate() == 0.0
@@ -53,6 +53,27 @@ class TestGetModifiedFiles:
         assert not any(".hidden" in r["path"] for r in result)
         assert any("visible.txt" in r["path"] for r in result)
 
+    def test_walks_nested_dirs_in_os_walk_order(self, tmp_path):
+        scanner = FilesystemScanner(workspace_dir=str(tmp_path))
+        for rel in ["top.txt", "a/one.txt", "a/deep/two.txt", "b/three.txt"]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        for pruned in ["node_modules/dep.js", ".cache/blob", "__pycache__/m.pyc"]:
+            path = tmp_path / pruned
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+
+        result = scanner.get_modified_files(str(tmp_path), hours=1)
+
+        expected = []
+        for root, dirs, files in os.walk(tmp_path):
+            dirs[:] = [d for d in dirs if d not in ("node_modules", "__pycache__")]
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            expected.extend(os.path.join(root, f) for f in files)
+        assert [r["path"] for r in result] == expected
+        assert len(expected) == 4
+
 
 class TestParseDailyReflection:
     def test_parses_filled_reflection(self, tmp_path):
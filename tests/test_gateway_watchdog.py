@@ -3,13 +3,58 @@
 import json
 import os
 import subprocess
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
 from gateway_watchdog import DEFAULT_PORT, GatewayWatchdog, probe_port
 
 
+def _state_bytes(statuses: list[str]) -> bytes:
+    history = [{"status": st} for st in statuses]
+    return json.dumps({"last_check": history[-1], "history": history}).encode()
+
+
+# Canned state files, encoded once at import
+_UPTIME_STATE = _state_bytes(["healthy"] * 8 + ["recovered"] * 2)
+_MIXED_STATE = _state_bytes(
+    ["healthy", "down", "critical_down", "degraded", "recovered", "healthy"]
+)
+_TOKEN_CONFIG = json.dumps(
+    {"gateway": {"auth": {"token": "my-secret-token"}, "port": 3000}}
+).encode()
+_PORT_CONFIG = json.dumps({"gateway": {"auth": {"token": ""}, "port": 9999}}).encode()
+_GATEWAY_ONLY_CONFIG = json.dumps({"gateway": {"port": 3000}}).encode()
+
+
+def _completed(returncode: int = 0, stderr: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout="", stderr=stderr)
+
+
+class FakeSocket:
+    """Minimal stand-in for ``socket.socket`` exposing only what probe_port uses."""
+
+    def __init__(self, side_effect: object = None) -> None:
+        self.connect = Mock(side_effect=side_effect)
+        self.settimeout = Mock()
+        self.close = Mock()
+
+    def __enter__(self) -> "FakeSocket":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@pytest.fixture
+def mock_sock(monkeypatch: pytest.MonkeyPatch) -> FakeSocket:
+    """Replace ``socket.socket`` with one shared fake; tests tweak ``connect``."""
+    sock = FakeSocket()
+    monkeypatch.setattr("gateway_watchdog.socket.socket", lambda *a, **k: sock)
+    return sock
+
+
 @pytest.fixture
 def watchdog(tmp_path: object) -> GatewayWatchdog:
     """Create a watchdog with a temp state dir and explicit services."""
@@ -17,6 +62,7 @@ def watchdog(tmp_path: object) -> GatewayWatchdog:
         port=3000,
         token="test-token",
         state_dir=str(tmp_path),
+        config_path=os.path.join(str(tmp_path), "openclaw.json"),
         max_retries=2,
         retry_delay=0,
         health_timeout=1,
@@ -40,6 +86,7 @@ def multi_service_watchdog(tmp_path: object) -> GatewayWatchdog:
         port=3000,
         token="test-token",
         state_dir=str(tmp_path),
+        config_path=os.path.join(str(tmp_path), "openclaw.json"),
         max_retries=1,
         retry_delay=0,
         health_timeout=1,
@@ -78,87 +125,68 @@ class TestDefaultPort:
 
 
 class TestProbePort:
-    def test_healthy_port(self) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            result = probe_port(3000, timeout=1)
-        assert result["healthy"] is True
-        assert result["port"] == 3000
-        mock_sock.connect.assert_called_once_with(("127.0.0.1", 3000))
-
-    def test_unhealthy_port(self) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = ConnectionRefusedError("refused")
-            mock_sock_cls.return_value = mock_sock
-            result = probe_port(18789, timeout=1)
-        assert result["healthy"] is False
-        assert result["port"] == 18789
+    @pytest.mark.parametrize(
+        ("side_effect", "port", "expected_healthy", "detail_substr"),
+        [
+            (None, 3000, True, "accepting connections"),
+            (None, 18789, True, "accepting connections"),
+            (ConnectionRefusedError("refused"), 18789, False, "refused"),
+            (TimeoutError("timed out"), 3000, False, "timed out"),
+        ],
+        ids=["healthy", "healthy-custom-port", "refused", "timeout"],
+    )
+    def test_probe_port(
+        self,
+        mock_sock: FakeSocket,
+        side_effect: Exception | None,
+        port: int,
+        expected_healthy: bool,
+        detail_substr: str,
+    ) -> None:
+        mock_sock.connect.side_effect = side_effect
+        result = probe_port(port, timeout=1)
+        assert result["healthy"] is expected_healthy
+        assert result["port"] == port
+        assert detail_substr in result["detail"]
+        mock_sock.connect.assert_called_once_with(("127.0.0.1", port))
+        mock_sock.close.assert_called_once()
 
 
 class TestCheckHealth:
-    def test_healthy_gateway(self, watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            health = watchdog.check_health()
+    @pytest.mark.parametrize(("port", "expected_port"), [(0, 3000), (18789, 18789)])
+    def test_check_health_probes_port(
+        self,
+        watchdog: GatewayWatchdog,
+        mock_sock: FakeSocket,
+        port: int,
+        expected_port: int,
+    ) -> None:
+        health = watchdog.check_health(port=port)
         assert health["healthy"] is True
-        mock_sock.connect.assert_called_once_with(("127.0.0.1", 3000))
+        assert health["port"] == expected_port
+        mock_sock.connect.assert_called_once_with(("127.0.0.1", expected_port))
+        mock_sock.settimeout.assert_called_once_with(watchdog.health_timeout)
         mock_sock.close.assert_called_once()
 
-    def test_unhealthy_connection_refused(self, watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = ConnectionRefusedError("refused")
-            mock_sock_cls.return_value = mock_sock
-            health = watchdog.check_health()
-        assert health["healthy"] is False
-        assert "refused" in health["detail"]
-
-    def test_unhealthy_timeout(self, watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = TimeoutError("timed out")
-            mock_sock_cls.return_value = mock_sock
-            health = watchdog.check_health()
-        assert health["healthy"] is False
-
-    def test_check_health_custom_port(self, watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            health = watchdog.check_health(port=18789)
-        assert health["healthy"] is True
-        mock_sock.connect.assert_called_once_with(("127.0.0.1", 18789))
-
 
+@pytest.mark.usefixtures("mock_sock")
 class TestCheckAllServices:
     def test_all_healthy(self, multi_service_watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            results = multi_service_watchdog.check_all_services()
+        results = multi_service_watchdog.check_all_services()
         assert len(results) == 3
         assert results["gateway"]["healthy"] is True
         assert results["enterprise"]["healthy"] is True
         assert results["vite-ui"]["healthy"] is True
 
-    def test_enterprise_down(self, multi_service_watchdog: GatewayWatchdog) -> None:
-        call_count = 0
-
+    def test_enterprise_down(
+        self, multi_service_watchdog: GatewayWatchdog, mock_sock: FakeSocket
+    ) -> None:
         def mock_connect(addr: tuple[str, int]) -> None:
-            nonlocal call_count
-            call_count += 1
-            # First call (gateway:3000) succeeds, second (enterprise:18789) fails
             if addr[1] == 18789:
                 raise ConnectionRefusedError("refused")
 
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = mock_connect
-            mock_sock_cls.return_value = mock_sock
-            results = multi_service_watchdog.check_all_services()
+        mock_sock.connect.side_effect = mock_connect
+        results = multi_service_watchdog.check_all_services()
 
         assert results["gateway"]["healthy"] is True
         assert results["enterprise"]["healthy"] is False
@@ -168,14 +196,15 @@ class TestCheckAllServices:
     def test_service_names_and_metadata(
         self, multi_service_watchdog: GatewayWatchdog
     ) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            results = multi_service_watchdog.check_all_services()
+        results = multi_service_watchdog.check_all_services()
         assert results["enterprise"]["service_name"] == "enterprise"
         assert results["enterprise"]["description"] == "Enterprise gateway"
         assert results["vite-ui"]["critical"] is False
 
+    def test_results_follow_service_order(self, multi_service_watchdog: GatewayWatchdog) -> None:
+        results = multi_service_watchdog.check_all_services()
+        assert list(results) == ["gateway", "enterprise", "vite-ui"]
+
 
 class TestRestartService:
     def test_restart_with_launchd(self, watchdog: GatewayWatchdog) -> None:
@@ -184,13 +213,18 @@ class TestRestartService:
             "launchd_label": "ai.openclaw.gateway",
             "plist": "~/Library/LaunchAgents/ai.openclaw.gateway.plist",
         }
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=0, stdout="", stderr=""
-            )
-            result = watchdog.restart_service(svc)
+        calls: list[list[str]] = []
+
+        def runner(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+            calls.append(cmd)
+            return _completed()
+
+        watchdog._runner = runner
+        result = watchdog.restart_service(svc)
         assert result["success"] is True
         assert result["method"] == "kickstart"
+        assert len(calls) == 1
+        assert calls[0][:3] == ["launchctl", "kickstart", "-k"]
 
     def test_no_launchd_label(self, watchdog: GatewayWatchdog) -> None:
         svc = {"name": "enterprise", "launchd_label": "", "plist": ""}
@@ -200,42 +234,38 @@ class TestRestartService:
         assert "Manual restart required" in result["output"]
 
     def test_restart_gateway_backward_compat(self, watchdog: GatewayWatchdog) -> None:
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=0, stdout="", stderr=""
-            )
-            result = watchdog.restart_gateway()
+        watchdog._runner = lambda *a, **k: _completed()
+        result = watchdog.restart_gateway()
         assert result["success"] is True
 
-    def test_fallback_to_bootout_bootstrap(self, watchdog: GatewayWatchdog) -> None:
+    def test_fallback_to_bootout_bootstrap(
+        self, watchdog: GatewayWatchdog, tmp_path: Path
+    ) -> None:
+        plist = tmp_path / "ai.openclaw.gateway.plist"
+        plist.write_text("<plist/>")
         svc = {
             "name": "gateway",
             "launchd_label": "ai.openclaw.gateway",
-            "plist": "~/Library/LaunchAgents/ai.openclaw.gateway.plist",
+            "plist": str(plist),
         }
-        fail = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="fail")
-        success = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
-        with (
-            patch("subprocess.run", side_effect=[fail, success, success]),
-            patch("gateway_watchdog.time.sleep"),
-        ):
-            result = watchdog.restart_service(svc)
+        responses = iter([_completed(1, "fail"), _completed(), _completed()])
+        watchdog._runner = lambda *a, **k: next(responses)
+        watchdog._sleeper = lambda _: None
+        result = watchdog.restart_service(svc)
         assert result["success"] is True
         assert result["method"] == "bootout+bootstrap"
 
 
+@pytest.mark.usefixtures("mock_sock")
 class TestRunCheck:
     def test_all_healthy_no_restart(self, watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            result = watchdog.run_check()
+        result = watchdog.run_check()
         assert result["status"] == "healthy"
         assert result["action"] == "none"
         assert "services" in result
 
     def test_enterprise_down_no_launchd(
-        self, multi_service_watchdog: GatewayWatchdog
+        self, multi_service_watchdog: GatewayWatchdog, mock_sock: FakeSocket
     ) -> None:
         """Enterprise gateway down but no launchd → critical_down (can't auto-fix)."""
 
@@ -243,21 +273,18 @@ class TestRunCheck:
             if addr[1] == 18789:
                 raise ConnectionRefusedError("refused")
 
-        with (
-            patch("gateway_watchdog.socket.socket") as mock_sock_cls,
-            patch("gateway_watchdog.time.sleep"),
-        ):
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = mock_connect
-            mock_sock_cls.return_value = mock_sock
-            result = multi_service_watchdog.run_check()
+        multi_service_watchdog._sleeper = lambda _: None
+        mock_sock.connect.side_effect = mock_connect
+        result = multi_service_watchdog.run_check()
 
         assert result["status"] == "critical_down"
         assert result["action"] == "escalate"
         assert "enterprise" in result["restart_results"]
         assert result["restart_results"]["enterprise"]["recovered"] is False
 
-    def test_gateway_down_then_recovered(self, watchdog: GatewayWatchdog) -> None:
+    def test_gateway_down_then_recovered(
+        self, watchdog: GatewayWatchdog, mock_sock: FakeSocket
+    ) -> None:
         call_count = 0
 
         def mock_connect(addr: tuple[str, int]) -> None:
@@ -267,30 +294,24 @@ class TestRunCheck:
                 raise ConnectionRefusedError("refused")
             # Subsequent probes succeed (after restart)
 
-        with (
-            patch("gateway_watchdog.socket.socket") as mock_sock_cls,
-            patch("subprocess.run") as mock_run,
-            patch("gateway_watchdog.time.sleep"),
-        ):
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = mock_connect
-            mock_sock_cls.return_value = mock_sock
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=0, stdout="", stderr=""
-            )
-            result = watchdog.run_check()
+        watchdog._runner = lambda *a, **k: _completed()
+        watchdog._sleeper = lambda _: None
+        mock_sock.connect.side_effect = mock_connect
+        result = watchdog.run_check()
 
         assert result["status"] == "recovered"
         assert result["action"] == "restarted"
 
-    def test_non_critical_down_is_degraded(self, tmp_path: object) -> None:
+    def test_non_critical_down_is_degraded(self, tmp_path: object, mock_sock: FakeSocket) -> None:
         """Non-critical service down → degraded, not critical_down."""
         wdog = GatewayWatchdog(
             port=3000,
             state_dir=str(tmp_path),
+            config_path=os.path.join(str(tmp_path), "openclaw.json"),
             max_retries=1,
             retry_delay=0,
             health_timeout=1,
+            sleeper=lambda _: None,
             services=[
                 {
                     "name": "vite-ui",
@@ -303,48 +324,41 @@ class TestRunCheck:
             ],
         )
 
-        with (
-            patch("gateway_watchdog.socket.socket") as mock_sock_cls,
-            patch("gateway_watchdog.time.sleep"),
-        ):
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = ConnectionRefusedError("refused")
-            mock_sock_cls.return_value = mock_sock
-            result = wdog.run_check()
+        mock_sock.connect.side_effect = ConnectionRefusedError("refused")
+        result = wdog.run_check()
 
         assert result["status"] == "degraded"
 
 
+@pytest.mark.usefixtures("mock_sock")
 class TestStatePersistence:
     def test_state_saved_and_loaded(self, watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            watchdog.run_check()
+        watchdog.run_check()
         status = watchdog.get_status()
         assert status["total_checks"] == 1
         assert status["healthy"] == 1
 
     def test_history_capped_at_50(self, watchdog: GatewayWatchdog) -> None:
-        with patch("gateway_watchdog.socket.socket") as mock_sock_cls:
-            mock_sock = MagicMock()
-            mock_sock_cls.return_value = mock_sock
-            for _ in range(55):
-                watchdog.run_check()
+        for _ in range(55):
+            watchdog.run_check()
         status = watchdog.get_status()
         assert status["total_checks"] == 50
 
     def test_uptime_percentage(self, watchdog: GatewayWatchdog) -> None:
-        history = [{"status": "healthy"} for _ in range(8)] + [
-            {"status": "recovered"} for _ in range(2)
-        ]
-        state = {"last_check": history[-1], "history": history}
-        with open(watchdog._state_file, "w") as f:
-            json.dump(state, f)
+        Path(watchdog._state_file).write_bytes(_UPTIME_STATE)
         status = watchdog.get_status()
         assert status["uptime_pct"] == 80.0
         assert status["recovered"] == 2
 
+    def test_status_counts_by_category(self, watchdog: GatewayWatchdog) -> None:
+        Path(watchdog._state_file).write_bytes(_MIXED_STATE)
+        status = watchdog.get_status()
+        assert status["total_checks"] == 6
+        assert status["healthy"] == 2
+        assert status["down"] == 2
+        assert status["degraded"] == 1
+        assert status["recovered"] == 1
+
     def test_monitored_services_in_status(
         self, multi_service_watchdog: GatewayWatchdog
     ) -> None:
@@ -355,48 +369,42 @@ class TestStatePersistence:
 
 
 class TestLoadConfig:
-    def test_loads_token_from_config(self, tmp_path: object) -> None:
-        config = {"gateway": {"auth": {"token": "my-secret-token"}, "port": 3000}}
-        config_path = os.path.join(str(tmp_path), "openclaw.json")
-        with open(config_path, "w") as f:
-            json.dump(config, f)
-        with patch("gateway_watchdog.os.path.expanduser", return_value=config_path):
-            wdog = GatewayWatchdog(state_dir=str(tmp_path))
+    def test_loads_token_from_config(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "openclaw.json"
+        config_path.write_bytes(_TOKEN_CONFIG)
+        wdog = GatewayWatchdog(state_dir=str(tmp_path), config_path=str(config_path))
         assert wdog.token == "my-secret-token"
 
-    def test_loads_port_from_config(self, tmp_path: object) -> None:
-        config = {"gateway": {"auth": {"token": ""}, "port": 9999}}
-        config_path = os.path.join(str(tmp_path), "openclaw.json")
-        with open(config_path, "w") as f:
-            json.dump(config, f)
-
-        orig_expand = os.path.expanduser
-
-        def mock_expand(p: str) -> str:
-            if "openclaw.json" in p or "openclaw/openclaw" in p:
-                return config_path
-            return orig_expand(p)
-
-        with patch("gateway_watchdog.os.path.expanduser", side_effect=mock_expand):
-            wdog = GatewayWatchdog(port=0, state_dir=str(tmp_path))
+    def test_loads_port_from_config(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "openclaw.json"
+        config_path.write_bytes(_PORT_CONFIG)
+        wdog = GatewayWatchdog(port=0, state_dir=str(tmp_path), config_path=str(config_path))
         assert wdog.port == 9999
 
-    def test_missing_config_uses_default_port(self, tmp_path: object) -> None:
-        with patch(
-            "gateway_watchdog.os.path.expanduser",
-            return_value=os.path.join(str(tmp_path), "nonexistent.json"),
-        ):
-            wdog = GatewayWatchdog(state_dir=str(tmp_path))
+    def test_missing_config_uses_default_port(self, tmp_path: Path) -> None:
+        wdog = GatewayWatchdog(
+            state_dir=str(tmp_path), config_path=str(tmp_path / "nonexistent.json")
+        )
         assert wdog.token == ""
         assert wdog.port == 3000
 
-    def test_auto_detects_enterprise_service(self, tmp_path: object) -> None:
-        config = {"gateway": {"port": 3000}}
-        config_path = os.path.join(str(tmp_path), "openclaw.json")
-        with open(config_path, "w") as f:
-            json.dump(config, f)
-        with patch("gateway_watchdog.os.path.expanduser", return_value=config_path):
-            wdog = GatewayWatchdog(state_dir=str(tmp_path))
+    def test_default_config_path(self, tmp_path: Path) -> None:
+        wdog = GatewayWatchdog(state_dir=str(tmp_path))
+        assert wdog.config_path == os.path.expanduser("~/.openclaw/openclaw.json")
+
+    def test_default_paths_follow_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HOME", str(tmp_path / "first"))
+        GatewayWatchdog(state_dir=str(tmp_path))
+        monkeypatch.setenv("HOME", str(tmp_path / "second"))
+        wdog = GatewayWatchdog(state_dir=str(tmp_path))
+        assert wdog.config_path == str(tmp_path / "second" / ".openclaw" / "openclaw.json")
+
+    def test_auto_detects_enterprise_service(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "openclaw.json"
+        config_path.write_bytes(_GATEWAY_ONLY_CONFIG)
+        wdog = GatewayWatchdog(state_dir=str(tmp_path), config_path=str(config_path))
         service_names = [s["name"] for s in wdog.services]
         assert "gateway" in service_names
         assert "enterprise" in service_names
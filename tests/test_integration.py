@@ -101,7 +101,7 @@ class TestVerificationHistoryExportIntegration:
         with open(filepath) as f:
             data = json.load(f)
 
-        assert data == fw.verification_history
+        assert data == list(fw.verification_history)
 
 
 class TestLoggingIntegration:
@@ -1,6 +1,58 @@
-"""Tests for LLMProvider — tests formatting, config, error handling (no API mocking)."""
+"""Tests for LLMProvider — tests formatting, config, error handling.
 
-from llm_provider import API_URL, API_VERSION, DEFAULT_MODEL, LLMProvider
+Connection tests swap in a fake HTTPSConnection; nothing here needs the real API.
+"""
+
+import http.client
+import json
+
+import pytest
+
+from llm_provider import API_URL, API_VERSION, DEFAULT_MODEL, KEEPALIVE_IDLE, LLMProvider
+
+_OK_BODY = json.dumps({"content": [{"type": "text", "text": "ok"}]}).encode("utf-8")
+
+
+class _FakeResponse:
+    def __init__(self, status=200, reason="OK", body=_OK_BODY):
+        self.status = status
+        self.reason = reason
+        self._body = body
+
+    def read(self):
+        return self._body
+
+
+@pytest.fixture()
+def fake_api(monkeypatch):
+    """Replace HTTPSConnection; each request pops the next scripted outcome.
+
+    An outcome is a _FakeResponse to return or an exception to raise from
+    getresponse(). Returns (outcomes, sent), where sent records the index of
+    the connection that carried each request.
+    """
+    outcomes = []
+    sent = []
+    opened = []
+
+    class FakeConnection:
+        def __init__(self, host, timeout=None):
+            opened.append(self)
+
+        def request(self, method, path, body=None, headers=None):
+            sent.append(opened.index(self))
+
+        def getresponse(self):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(http.client, "HTTPSConnection", FakeConnection)
+    return outcomes, sent
 
 
 class TestLLMProviderInit:
@@ -37,6 +89,13 @@ class TestRequestFormatting:
         req = provider.format_request(messages)
         assert req["body"]["messages"] == messages
 
+    def test_format_request_headers_are_independent_copies(self):
+        provider = LLMProvider(api_key="sk-test")
+        first = provider.format_request([])
+        first["headers"]["x-api-key"] = "mutated"
+        second = provider.format_request([])
+        assert second["headers"]["x-api-key"] == "sk-test"
+
 
 class TestAnalyze:
     def test_analyze_returns_empty_when_unavailable(self):
@@ -49,3 +108,59 @@ class TestAnalyze:
         provider = LLMProvider(api_key="sk-invalid-key")
         result = provider._call_api([{"role": "user", "content": "hi"}], max_tokens=10)
         assert result == ""
+
+
+class TestConnectionLifecycle:
+    def test_no_connection_until_first_call(self):
+        provider = LLMProvider(api_key="sk-test")
+        assert provider._conn is None
+
+    def test_close_is_idempotent(self):
+        provider = LLMProvider(api_key="sk-test")
+        provider.close()
+        provider.close()
+        assert provider._conn is None
+
+    def test_stale_reused_connection_retried_once(self, fake_api):
+        outcomes, sent = fake_api
+        outcomes.extend(
+            [_FakeResponse(), http.client.RemoteDisconnected("closed"), _FakeResponse()]
+        )
+        provider = LLMProvider(api_key="sk-test")
+        assert provider.analyze("first") == "ok"
+        assert provider.analyze("second") == "ok"
+        # The second call failed on the kept-alive connection and was resent on a new one
+        assert sent == [0, 0, 1]
+
+    def test_fresh_connection_failure_not_retried(self, fake_api):
+        outcomes, sent = fake_api
+        outcomes.extend([http.client.RemoteDisconnected("closed"), _FakeResponse()])
+        provider = LLMProvider(api_key="sk-test")
+        assert provider.analyze("hi") == ""
+        assert sent == [0]
+        assert provider._conn is None
+
+    def test_reset_within_keepalive_window_not_resent(self, fake_api):
+        outcomes, sent = fake_api
+        outcomes.extend([_FakeResponse(), ConnectionResetError("reset"), _FakeResponse()])
+        provider = LLMProvider(api_key="sk-test")
+        assert provider.analyze("first") == "ok"
+        assert provider.analyze("second") == ""
+        assert sent == [0, 0]
+
+    def test_http_error_returns_empty(self, fake_api):
+        outcomes, sent = fake_api
+        outcomes.append(_FakeResponse(status=401, reason="Unauthorized", body=b"{}"))
+        provider = LLMProvider(api_key="sk-test")
+        assert provider.analyze("hi") == ""
+        assert sent == [0]
+
+    def test_idle_connection_replaced_before_sending(self, fake_api):
+        outcomes, sent = fake_api
+        outcomes.extend([_FakeResponse(), _FakeResponse()])
+        provider = LLMProvider(api_key="sk-test")
+        assert provider.analyze("first") == "ok"
+        provider._last_used -= KEEPALIVE_IDLE + 1
+        assert provider.analyze("hours later") == "ok"
+        # The idle socket was never written to; the request went out on a new connection
+        assert sent == [0, 1]
@@ -2,33 +2,17 @@
 
 import json
 import os
+import shutil
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import pytest
 
 from marketing_eval import MarketingEvalEngine
 
-# ── Fixtures ────────────────────────────────────────────────────────────
-
-
-@pytest.fixture()
-def engine(tmp_path):
-    """Create a MarketingEvalEngine with temp dirs."""
-    marketing_dir = tmp_path / "marketing"
-    marketing_dir.mkdir()
-    state_dir = tmp_path / "state"
-    state_dir.mkdir()
-    return MarketingEvalEngine(
-        project_root=str(tmp_path),
-        state_dir=str(state_dir),
-        marketing_dir=str(marketing_dir),
-    )
+# ── Fixture payloads ────────────────────────────────────────────────────
 
-
-@pytest.fixture()
-def multi_post_file(engine):
-    """Create a multi-post markdown file."""
-    content = """# Social Posts
+_MULTI_POST_BYTES = b"""# Social Posts
 
 ---
 
@@ -64,16 +48,8 @@ Star if this resonated: [link]
 
 #AI #OpenSource
 """
-    filepath = os.path.join(engine.marketing_dir, "social-posts.md")
-    with open(filepath, "w") as f:
-        f.write(content)
-    return filepath
 
-
-@pytest.fixture()
-def article_file(engine):
-    """Create a single-article markdown file."""
-    content = """# I Built a System That Catches My AI Agent
+_ARTICLE_BYTES = b"""# I Built a System That Catches My AI Agent
 
 A story about idle detection and self-improvement.
 
@@ -86,19 +62,119 @@ Check out the repo: https://github.com/example
 
 #AI #SelfImprovement
 """
-    filepath = os.path.join(engine.marketing_dir, "linkedin-article.md")
-    with open(filepath, "w") as f:
-        f.write(content)
-    return filepath
+
+_README_BYTES = b"# Marketing\n\nThis is a README.\n"
+
+_MARKDOWN_FILES = {
+    "social-posts.md": _MULTI_POST_BYTES,
+    "linkedin-article.md": _ARTICLE_BYTES,
+    "README.md": _README_BYTES,
+}
+
+
+def _write_markdown(marketing_dir, name):
+    """Write one of the canned markdown files into marketing_dir; return its path."""
+    filepath = Path(marketing_dir) / name
+    filepath.write_bytes(_MARKDOWN_FILES[name])
+    return str(filepath)
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def _engine_shell(tmp_path_factory):
+    """Build the temp dirs and MarketingEvalEngine once per module."""
+    root = tmp_path_factory.mktemp("marketing-eval")
+    marketing_dir = root / "marketing"
+    marketing_dir.mkdir()
+    state_dir = root / "state"
+    state_dir.mkdir()
+    return MarketingEvalEngine(
+        project_root=str(root),
+        state_dir=str(state_dir),
+        marketing_dir=str(marketing_dir),
+    )
 
 
 @pytest.fixture()
-def readme_file(engine):
-    """Create a README.md that should be skipped."""
-    filepath = os.path.join(engine.marketing_dir, "README.md")
-    with open(filepath, "w") as f:
-        f.write("# Marketing\n\nThis is a README.\n")
-    return filepath
+def engine(_engine_shell):
+    """Hand out the shared engine with empty marketing/ and state/ dirs."""
+    for directory in (_engine_shell.marketing_dir, _engine_shell.state_dir):
+        for entry in Path(directory).iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+    return _engine_shell
+
+
+@pytest.fixture()
+def multi_post_file(engine):
+    """Create a multi-post markdown file."""
+    return _write_markdown(engine.marketing_dir, "social-posts.md")
+
+
+@pytest.fixture()
+def article_file(engine):
+    """Create a single-article markdown file."""
+    return _write_markdown(engine.marketing_dir, "linkedin-article.md")
+
+
+@pytest.fixture(scope="module")
+def _primed(tmp_path_factory):
+    """Discover the multi-post file once; return the result and the state files it wrote."""
+    root = tmp_path_factory.mktemp("marketing-primed")
+    marketing_dir = root / "marketing"
+    marketing_dir.mkdir()
+    state_dir = root / "state"
+    state_dir.mkdir()
+    _write_markdown(marketing_dir, "social-posts.md")
+    engine = MarketingEvalEngine(
+        project_root=str(root),
+        state_dir=str(state_dir),
+        marketing_dir=str(marketing_dir),
+    )
+    result = engine.discover_content()
+    snapshot = {entry.name: entry.read_bytes() for entry in state_dir.iterdir()}
+    return result, snapshot
+
+
+@pytest.fixture(scope="module")
+def discovered(_primed):
+    """Shared discover_content() result for the read-only discovery tests."""
+    return _primed[0]
+
+
+@pytest.fixture()
+def primed(engine, multi_post_file, _primed):
+    """The shared engine in its post-discovery state, without re-parsing markdown."""
+    for name, data in _primed[1].items():
+        (Path(engine.state_dir) / name).write_bytes(data)
+    return engine
+
+
+@pytest.fixture()
+def now():
+    """One frozen UTC timestamp per test."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture()
+def now_iso(now):
+    """ISO form of ``now``, formatted once."""
+    return now.isoformat()
+
+
+def _index(content):
+    """Key a list of content items by content_id."""
+    return {c["content_id"]: c for c in content}
+
+
+def _write_history(engine, entries):
+    """Write entries to the engine's JSONL history log."""
+    with open(engine._history_file, "w") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries)
 
 
 def _make_published(engine, content_id, metrics=None, days_ago=5):
@@ -111,6 +187,21 @@ def _make_published(engine, content_id, metrics=None, days_ago=5):
         engine.update_metrics(content_id, metrics)
 
 
+def _seed(engine, *, published=None, metrics=None):
+    """Publish and set metrics on several discovered items with one load and one save.
+
+    ``published`` maps content_id -> (url, date); ``metrics`` maps content_id ->
+    partial metrics, merged like update_metrics.
+    """
+    content = engine._load_content()
+    by_id = _index(content)
+    for content_id, (url, date) in (published or {}).items():
+        by_id[content_id].update(status="published", url=url, published_date=date)
+    for content_id, updates in (metrics or {}).items():
+        by_id[content_id]["metrics"] = {**by_id[content_id].get("metrics", {}), **updates}
+    engine._save_content(content)
+
+
 # ── TestDiscovery ───────────────────────────────────────────────────────
 
 
@@ -121,12 +212,11 @@ class TestDiscovery:
         assert result["published"] == 0
         assert result["draft"] == 0
 
-    def test_discover_multi_post_file(self, engine, multi_post_file):
-        result = engine.discover_content()
-        assert result["total"] == 3
+    def test_discover_multi_post_file(self, discovered):
+        assert discovered["total"] == 3
         # All should be drafts initially
-        assert result["draft"] == 3
-        assert result["published"] == 0
+        assert discovered["draft"] == 3
+        assert discovered["published"] == 0
 
     def test_discover_article(self, engine, article_file):
         result = engine.discover_content()
@@ -135,31 +225,31 @@ class TestDiscovery:
         assert content["content_type"] == "article"
         assert content["content_id"] == "linkedin-article"
 
-    def test_discover_skips_readme(self, engine, multi_post_file, readme_file):
+    def test_discover_skips_readme(self, engine):
+        _write_markdown(engine.marketing_dir, "social-posts.md")
+        _write_markdown(engine.marketing_dir, "README.md")
         result = engine.discover_content()
         # Should find 3 posts but NOT the README
         assert result["total"] == 3
         ids = [c["content_id"] for c in result["content"]]
         assert "README" not in ids
 
-    def test_detect_attributes_code_block(self, engine, multi_post_file):
-        result = engine.discover_content()
+    def test_detect_attributes_code_block(self, discovered):
+        by_id = _index(discovered["content"])
         # Post 2 has a code block
-        post2 = next(c for c in result["content"] if c["content_id"] == "social-posts-post-2")
+        post2 = by_id["social-posts-post-2"]
         assert post2["has_code_block"] is True
         # Post 3 does not
-        post3 = next(c for c in result["content"] if c["content_id"] == "social-posts-post-3")
+        post3 = by_id["social-posts-post-3"]
         assert post3["has_code_block"] is False
 
-    def test_detect_attributes_link_and_cta(self, engine, multi_post_file):
-        result = engine.discover_content()
-        post1 = next(c for c in result["content"] if c["content_id"] == "social-posts-post-1")
+    def test_detect_attributes_link_and_cta(self, discovered):
+        post1 = _index(discovered["content"])["social-posts-post-1"]
         assert post1["has_link"] is True
         assert post1["has_cta"] is True  # "Full story"
 
-    def test_detect_attributes_hashtags(self, engine, multi_post_file):
-        result = engine.discover_content()
-        post1 = next(c for c in result["content"] if c["content_id"] == "social-posts-post-1")
+    def test_detect_attributes_hashtags(self, discovered):
+        post1 = _index(discovered["content"])["social-posts-post-1"]
         assert len(post1["hashtags"]) >= 2
 
     def test_hash_change_detection(self, engine, multi_post_file):
@@ -178,13 +268,45 @@ class TestDiscovery:
         result3 = engine.discover_content()
         assert len(result3["new"]) >= 1  # Post 4 is new
 
-    def test_channel_inference(self, engine, multi_post_file):
+    def test_unchanged_file_not_reparsed(self, engine, multi_post_file, monkeypatch):
+        first = engine.discover_content()
+
+        def fail_parse(*args):
+            raise AssertionError("unchanged file was re-parsed")
+
+        monkeypatch.setattr(engine, "_parse_content_items", fail_parse)
+        second = engine.discover_content()
+        assert second["content"] == first["content"]
+        assert second["new"] == []
+        assert second["modified"] == []
+
+    def test_pattern_change_reparses_unchanged_file(self, engine, multi_post_file, monkeypatch):
+        engine.discover_content()
+        monkeypatch.setattr("marketing_eval.CHANNEL_PATTERNS", {"mastodon": ["twitter"]})
+        result = engine.discover_content()
+        assert _index(result["content"])["social-posts-post-1"]["channel"] == "mastodon"
+        assert result["modified"] == []
+
+    def test_stored_record_without_hash_is_reparsed(self, engine, multi_post_file):
+        engine.discover_content()
+        content = engine._load_content()
+        for c in content:
+            del c["hash"]
+        engine._save_content(content)
+        hashes = engine._load_hashes()
+        engine._save_hashes({k: v for k, v in hashes.items() if "-post-" not in k})
+
         result = engine.discover_content()
-        post1 = next(c for c in result["content"] if c["content_id"] == "social-posts-post-1")
+        assert all("hash" in c for c in result["content"])
+        assert len(result["new"]) == 3
+
+    def test_channel_inference(self, discovered):
+        by_id = _index(discovered["content"])
+        post1 = by_id["social-posts-post-1"]
         assert post1["channel"] == "twitter"
-        post2 = next(c for c in result["content"] if c["content_id"] == "social-posts-post-2")
+        post2 = by_id["social-posts-post-2"]
         assert post2["channel"] == "linkedin"
-        post3 = next(c for c in result["content"] if c["content_id"] == "social-posts-post-3")
+        post3 = by_id["social-posts-post-3"]
         assert post3["channel"] == "reddit"
 
 
@@ -192,47 +314,47 @@ class TestDiscovery:
 
 
 class TestScoring:
-    def test_draft_gets_quality_only(self, engine, multi_post_file):
-        engine.discover_content()
-        content_list = engine._load_content()
+    def test_draft_gets_quality_only(self, primed):
+        content_list = primed._load_content()
         draft = content_list[0]
-        score = engine.score_content(draft)
+        score = primed.score_content(draft)
         assert score["is_draft"] is True
         assert score["engagement_rate"] == 0
         assert score["reach"] == 0
 
-    def test_engagement_rate_formula(self, engine):
+    def test_engagement_rate_formula(self):
         metrics = {"impressions": 1000, "engagements": 50}
-        rate = engine._score_engagement_rate(metrics)
+        rate = MarketingEvalEngine._score_engagement_rate(metrics)
         assert rate == pytest.approx(50.0)  # 50/1000 * 1000 = 50
 
-    def test_engagement_rate_capped(self, engine):
+    def test_engagement_rate_capped(self):
         metrics = {"impressions": 100, "engagements": 50}
-        rate = engine._score_engagement_rate(metrics)
+        rate = MarketingEvalEngine._score_engagement_rate(metrics)
         assert rate == 100.0  # capped
 
-    def test_engagement_rate_zero_impressions(self, engine):
-        rate = engine._score_engagement_rate({"impressions": 0, "engagements": 10})
+    def test_engagement_rate_zero_impressions(self):
+        rate = MarketingEvalEngine._score_engagement_rate({"impressions": 0, "engagements": 10})
         assert rate == 0.0
 
-    def test_reach_scoring(self, engine):
+    def test_reach_scoring(self):
         # Twitter: good=5000, great=20000
-        assert engine._score_reach({"impressions": 0}, "twitter") == 0.0
-        assert engine._score_reach({"impressions": 20000}, "twitter") == 100.0
+        score_reach = MarketingEvalEngine._score_reach
+        assert score_reach({"impressions": 0}, "twitter") == 0.0
+        assert score_reach({"impressions": 20000}, "twitter") == 100.0
         # At 5000 (good threshold): should be 50
-        assert engine._score_reach({"impressions": 5000}, "twitter") == pytest.approx(50.0)
+        assert score_reach({"impressions": 5000}, "twitter") == pytest.approx(50.0)
 
-    def test_conversion_formula(self, engine):
+    def test_conversion_formula(self):
         metrics = {"engagements": 100, "clicks": 20, "conversions": 5}
-        conv = engine._score_conversion(metrics)
+        conv = MarketingEvalEngine._score_conversion(metrics)
         assert conv == pytest.approx(50.0)  # (20+5)/100 * 200 = 50
 
-    def test_conversion_capped(self, engine):
+    def test_conversion_capped(self):
         metrics = {"engagements": 10, "clicks": 20, "conversions": 5}
-        conv = engine._score_conversion(metrics)
+        conv = MarketingEvalEngine._score_conversion(metrics)
         assert conv == 100.0
 
-    def test_content_quality_full_score(self, engine):
+    def test_content_quality_full_score(self):
         content = {
             "word_count": 100,
             "has_cta": True,
@@ -240,43 +362,45 @@ class TestScoring:
             "has_code_block": True,
             "hashtags": ["#test"],
         }
-        assert engine._score_content_quality(content) == 100.0
+        assert MarketingEvalEngine._score_content_quality(content) == 100.0
 
-    def test_freshness_decay(self, engine):
-        now = datetime.now(timezone.utc)
+    def test_freshness_decay(self, now, now_iso):
         # Published today: 100
-        assert engine._score_freshness(now.isoformat()) == pytest.approx(100.0, abs=2)
+        assert MarketingEvalEngine._score_freshness(now_iso, now) == 100.0
         # Published 25 days ago: 100 - 25*2 = 50
         old = (now - timedelta(days=25)).isoformat()
-        assert engine._score_freshness(old) == pytest.approx(50.0, abs=2)
+        assert MarketingEvalEngine._score_freshness(old, now) == 50.0
         # Published 60 days ago: clamped to 0
         very_old = (now - timedelta(days=60)).isoformat()
-        assert engine._score_freshness(very_old) == 0.0
-
-    def test_grade_boundaries(self, engine):
-        assert engine._score_to_grade(95) == "A"
-        assert engine._score_to_grade(90) == "A"
-        assert engine._score_to_grade(89.9) == "B"
-        assert engine._score_to_grade(80) == "B"
-        assert engine._score_to_grade(79.9) == "C"
-        assert engine._score_to_grade(70) == "C"
-        assert engine._score_to_grade(60) == "D"
-        assert engine._score_to_grade(59.9) == "F"
-
-    def test_composite_published_content(self, engine, multi_post_file):
-        engine.discover_content()
+        assert MarketingEvalEngine._score_freshness(very_old, now) == 0.0
+
+    def test_freshness_accepts_datetime(self, now):
+        assert MarketingEvalEngine._score_freshness(now - timedelta(days=25), now) == 50.0
+
+    def test_freshness_uses_supplied_now(self):
+        now = datetime(2025, 6, 26, tzinfo=timezone.utc)
+        assert MarketingEvalEngine._score_freshness("2025-06-01T00:00:00+00:00", now) == 50.0
+
+    @pytest.mark.parametrize(
+        ("score", "grade"),
+        [(95, "A"), (90, "A"), (89.9, "B"), (80, "B"), (79.9, "C"), (70, "C"), (60, "D"),
+         (59.9, "F")],
+    )
+    def test_grade_boundaries(self, score, grade):
+        assert MarketingEvalEngine._score_to_grade(score) == grade
+
+    def test_composite_published_content(self, primed, now_iso):
         cid = "social-posts-post-1"
-        pub_date = datetime.now(timezone.utc).isoformat()
-        engine.set_published(cid, "https://example.com", pub_date)
-        engine.update_metrics(cid, {
+        primed.set_published(cid, "https://example.com", now_iso)
+        primed.update_metrics(cid, {
             "impressions": 10000,
             "engagements": 500,
             "clicks": 50,
             "conversions": 10,
         })
-        content_list = engine._load_content()
-        published = next(c for c in content_list if c["content_id"] == cid)
-        score = engine.score_content(published)
+        content_list = primed._load_content()
+        published = _index(content_list)[cid]
+        score = primed.score_content(published)
         assert not score["is_draft"]
         assert score["composite"] > 0
 
@@ -289,126 +413,122 @@ class TestRecommendations:
         recs = engine.generate_recommendations()
         assert isinstance(recs, list)
 
-    def test_channel_optimization(self, engine, multi_post_file):
-        engine.discover_content()
+    def test_channel_optimization(self, primed, now_iso):
         # Publish posts on different channels with different metrics
-        pub_date = datetime.now(timezone.utc).isoformat()
-        engine.set_published("social-posts-post-1", "https://x.com/1", pub_date)
-        engine.update_metrics("social-posts-post-1", {
-            "impressions": 20000, "engagements": 1000, "clicks": 100, "conversions": 20,
-        })
-        engine.set_published("social-posts-post-2", "https://linkedin.com/2", pub_date)
-        engine.update_metrics("social-posts-post-2", {
-            "impressions": 500, "engagements": 10, "clicks": 1, "conversions": 0,
-        })
-        recs = engine.generate_recommendations()
+        _seed(
+            primed,
+            published={
+                "social-posts-post-1": ("https://x.com/1", now_iso),
+                "social-posts-post-2": ("https://linkedin.com/2", now_iso),
+            },
+            metrics={
+                "social-posts-post-1": {
+                    "impressions": 20000, "engagements": 1000, "clicks": 100, "conversions": 20,
+                },
+                "social-posts-post-2": {
+                    "impressions": 500, "engagements": 10, "clicks": 1, "conversions": 0,
+                },
+            },
+        )
+        recs = primed.generate_recommendations()
         channel_recs = [r for r in recs if r["type"] == "channel_optimization"]
         assert len(channel_recs) >= 1
 
-    def test_cadence_too_slow(self, engine, multi_post_file):
-        engine.discover_content()
-        now = datetime.now(timezone.utc)
+    def test_cadence_too_slow(self, primed, now, now_iso):
         # Publish two posts 15 days apart
-        engine.set_published(
+        primed.set_published(
             "social-posts-post-1", "https://x.com/1",
             (now - timedelta(days=15)).isoformat(),
         )
-        engine.set_published(
+        primed.set_published(
             "social-posts-post-2", "https://li.com/2",
-            now.isoformat(),
+            now_iso,
         )
-        recs = engine.generate_recommendations()
+        recs = primed.generate_recommendations()
         cadence_recs = [r for r in recs if r["type"] == "cadence"]
         assert len(cadence_recs) >= 1
         assert "publish more often" in cadence_recs[0]["message"]
 
-    def test_cadence_too_fast(self, engine, multi_post_file):
-        engine.discover_content()
-        now = datetime.now(timezone.utc)
-        engine.set_published(
+    def test_cadence_too_fast(self, primed, now, now_iso):
+        primed.set_published(
             "social-posts-post-1", "https://x.com/1",
             (now - timedelta(hours=12)).isoformat(),
         )
-        engine.set_published(
+        primed.set_published(
             "social-posts-post-2", "https://li.com/2",
-            now.isoformat(),
+            now_iso,
         )
-        recs = engine.generate_recommendations()
+        recs = primed.generate_recommendations()
         cadence_recs = [r for r in recs if r["type"] == "cadence"]
         assert len(cadence_recs) >= 1
         assert "quality over quantity" in cadence_recs[0]["message"]
 
-    def test_underperformer_flagged(self, engine, multi_post_file):
-        engine.discover_content()
-        pub_date = datetime.now(timezone.utc).isoformat()
-        engine.set_published("social-posts-post-1", "https://x.com/1", pub_date)
-        engine.update_metrics("social-posts-post-1", {
+    def test_underperformer_flagged(self, primed, now_iso):
+        primed.set_published("social-posts-post-1", "https://x.com/1", now_iso)
+        primed.update_metrics("social-posts-post-1", {
             "impressions": 50, "engagements": 1, "clicks": 0, "conversions": 0,
         })
-        recs = engine.generate_recommendations()
+        recs = primed.generate_recommendations()
         underperformers = [r for r in recs if r["type"] == "underperformer"]
         assert len(underperformers) >= 1
 
-    def test_intervention_tier_mapping(self, engine, multi_post_file):
-        engine.discover_content()
+    def test_intervention_tier_mapping(self, primed):
         # All drafts with low quality → F grade → tier 3
-        recs = engine.generate_recommendations()
+        recs = primed.generate_recommendations()
         intervention_recs = [r for r in recs if r["type"] == "intervention"]
         # Grade depends on draft quality scores
         assert isinstance(intervention_recs, list)
 
-    def test_next_content_suggestion(self, engine, multi_post_file):
-        engine.discover_content()
-        pub_date = datetime.now(timezone.utc).isoformat()
-        engine.set_published("social-posts-post-1", "https://x.com/1", pub_date)
-        engine.update_metrics("social-posts-post-1", {
+    def test_next_content_suggestion(self, primed, now_iso):
+        primed.set_published("social-posts-post-1", "https://x.com/1", now_iso)
+        primed.update_metrics("social-posts-post-1", {
             "impressions": 10000, "engagements": 500, "clicks": 50, "conversions": 10,
         })
-        recs = engine.generate_recommendations()
+        recs = primed.generate_recommendations()
         next_recs = [r for r in recs if r["type"] == "next_content"]
         assert len(next_recs) >= 1
 
-    def test_10x_signal_detection(self, engine, multi_post_file):
-        engine.discover_content()
+    def test_10x_signal_detection(self, primed, now, now_iso):
         # Use an old publish date so freshness doesn't inflate low-performers
-        old_date = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
-        new_date = datetime.now(timezone.utc).isoformat()
-        engine.set_published("social-posts-post-1", "https://x.com/1", new_date)
-        engine.set_published("social-posts-post-2", "https://li.com/2", old_date)
-        engine.set_published("social-posts-post-3", "https://reddit.com/3", old_date)
-
-        # Post 1 gets massively more engagement; others get near-zero
-        engine.update_metrics("social-posts-post-1", {
-            "impressions": 50000, "engagements": 5000, "clicks": 500, "conversions": 100,
-        })
-        engine.update_metrics("social-posts-post-2", {
-            "impressions": 10, "engagements": 0, "clicks": 0, "conversions": 0,
-        })
-        engine.update_metrics("social-posts-post-3", {
-            "impressions": 10, "engagements": 0, "clicks": 0, "conversions": 0,
-        })
-        recs = engine.generate_recommendations()
+        old_date = (now - timedelta(days=60)).isoformat()
+        near_zero = {"impressions": 10, "engagements": 0, "clicks": 0, "conversions": 0}
+        _seed(
+            primed,
+            published={
+                "social-posts-post-1": ("https://x.com/1", now_iso),
+                "social-posts-post-2": ("https://li.com/2", old_date),
+                "social-posts-post-3": ("https://reddit.com/3", old_date),
+            },
+            # Post 1 gets massively more engagement; others get near-zero
+            metrics={
+                "social-posts-post-1": {
+                    "impressions": 50000, "engagements": 5000, "clicks": 500, "conversions": 100,
+                },
+                "social-posts-post-2": near_zero,
+                "social-posts-post-3": near_zero,
+            },
+        )
+        recs = primed.generate_recommendations()
         signals = [r for r in recs if r["type"] == "10x_signal"]
         assert len(signals) >= 1
 
-    def test_attribute_correlation(self, engine, multi_post_file):
-        engine.discover_content()
-        pub_date = datetime.now(timezone.utc).isoformat()
+    def test_attribute_correlation(self, primed, now_iso):
         # Post 2 has code block, post 1 and 3 do not
-        for cid in ["social-posts-post-1", "social-posts-post-2", "social-posts-post-3"]:
-            engine.set_published(cid, f"https://x.com/{cid}", pub_date)
-
-        # Give the code-block post much higher engagement
-        engine.update_metrics("social-posts-post-2", {
-            "impressions": 20000, "engagements": 2000, "clicks": 200, "conversions": 20,
-        })
-        engine.update_metrics("social-posts-post-1", {
-            "impressions": 1000, "engagements": 10, "clicks": 1, "conversions": 0,
-        })
-        engine.update_metrics("social-posts-post-3", {
-            "impressions": 1000, "engagements": 10, "clicks": 1, "conversions": 0,
-        })
-        recs = engine.generate_recommendations()
+        cids = ["social-posts-post-1", "social-posts-post-2", "social-posts-post-3"]
+        low = {"impressions": 1000, "engagements": 10, "clicks": 1, "conversions": 0}
+        _seed(
+            primed,
+            published={cid: (f"https://x.com/{cid}", now_iso) for cid in cids},
+            # Give the code-block post much higher engagement
+            metrics={
+                "social-posts-post-1": low,
+                "social-posts-post-2": {
+                    "impressions": 20000, "engagements": 2000, "clicks": 200, "conversions": 20,
+                },
+                "social-posts-post-3": low,
+            },
+        )
+        recs = primed.generate_recommendations()
         attr_recs = [r for r in recs if r["type"] == "attribute_correlation"]
         assert len(attr_recs) >= 1
 
@@ -472,14 +592,58 @@ class TestHistory:
 
     def test_fifo_cap_at_90(self, engine):
         # Manually write 95 entries
-        history = [{"composite_score": i, "timestamp": f"t{i}"} for i in range(95)]
-        with open(engine._history_file, "w") as f:
-            json.dump(history, f)
+        _write_history(engine, [{"composite_score": i, "timestamp": f"t{i}"} for i in range(95)])
         # Save one more
         engine._save_eval({"composite_score": 999, "timestamp": "t999"})
         loaded = engine._load_history()
         assert len(loaded) == 90
         assert loaded[-1]["composite_score"] == 999
+        # The save appended a single line instead of rewriting the log
+        assert len(Path(engine._history_file).read_bytes().splitlines()) == 96
+
+    def test_log_compacted_at_twice_the_cap(self, engine):
+        _write_history(engine, [{"composite_score": i, "timestamp": f"t{i}"} for i in range(179)])
+        engine._save_eval({"composite_score": 999, "timestamp": "t999"})
+        assert len(Path(engine._history_file).read_bytes().splitlines()) == 90
+        loaded = engine._load_history()
+        assert loaded[0]["composite_score"] == 90
+        assert loaded[-1]["composite_score"] == 999
+
+    def test_legacy_json_history_migrated(self, engine):
+        history = [{"composite_score": 50, "timestamp": "t1"}]
+        with open(engine._legacy_history_file, "w") as f:
+            json.dump(history, f)
+        assert engine._load_history() == history
+
+        engine._save_eval({"composite_score": 60, "timestamp": "t2"})
+        assert not os.path.exists(engine._legacy_history_file)
+        assert [h["composite_score"] for h in engine._load_history()] == [50, 60]
+
+    def test_torn_history_line_skipped(self, engine):
+        with open(engine._history_file, "w") as f:
+            f.write('{"composite_score": 50}\n{"composite_sc')
+        assert engine._load_history() == [{"composite_score": 50}]
+
+    def test_save_after_torn_line_starts_new_line(self, engine):
+        with open(engine._history_file, "w") as f:
+            f.write('{"composite_score": 50}\n{"composite_sc')
+        engine._save_eval({"composite_score": 60, "timestamp": "t2"})
+        assert [h["composite_score"] for h in engine._load_history()] == [50, 60]
+
+    def test_failed_save_not_persisted(self, engine, multi_post_file, monkeypatch):
+        engine.discover_content()
+        engine._load_content()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        engine.update_metrics("social-posts-post-1", {"impressions": 5000})
+        monkeypatch.undo()
+
+        # The in-place edit was never persisted, so a reload must not see it
+        post = _index(engine._load_content())["social-posts-post-1"]
+        assert post["metrics"] == {}
 
     def test_trend_summary_insufficient(self, engine):
         summary = engine.get_trend_summary()
@@ -491,8 +655,7 @@ class TestHistory:
             {"composite_score": 60, "timestamp": "t2"},
             {"composite_score": 70, "timestamp": "t3"},
         ]
-        with open(engine._history_file, "w") as f:
-            json.dump(history, f)
+        _write_history(engine, history)
         summary = engine.get_trend_summary()
         assert summary["evaluations"] == 3
         assert summary["latest_score"] == 70
@@ -500,45 +663,51 @@ class TestHistory:
         assert summary["worst_score"] == 50
         assert summary["average_score"] == pytest.approx(60.0)
 
+    def test_trend_summary_covers_capped_window(self, engine):
+        _write_history(engine, [{"composite_score": i, "timestamp": f"t{i}"} for i in range(95)])
+        summary = engine.get_trend_summary()
+        # Only the newest 90 entries (scores 5..94) are summarized
+        assert summary["evaluations"] == 90
+        assert summary["worst_score"] == 5
+        assert summary["best_score"] == 94
+        assert summary["average_score"] == pytest.approx(49.5)
+        assert summary["scores_last_7"] == list(range(88, 95))
+
 
 # ── TestMetricsEntry ────────────────────────────────────────────────────
 
 
 class TestMetricsEntry:
-    def test_update_metrics(self, engine, multi_post_file):
-        engine.discover_content()
-        result = engine.update_metrics("social-posts-post-1", {
+    def test_update_metrics(self, primed):
+        result = primed.update_metrics("social-posts-post-1", {
             "impressions": 5000, "engagements": 200,
         })
         assert result["success"] is True
         # Verify persisted
-        content = engine._load_content()
-        post = next(c for c in content if c["content_id"] == "social-posts-post-1")
+        content = primed._load_content()
+        post = _index(content)["social-posts-post-1"]
         assert post["metrics"]["impressions"] == 5000
 
-    def test_set_published(self, engine, multi_post_file):
-        engine.discover_content()
-        result = engine.set_published(
+    def test_set_published(self, primed):
+        result = primed.set_published(
             "social-posts-post-1", "https://twitter.com/post/1", "2025-06-01T00:00:00+00:00"
         )
         assert result["success"] is True
         assert result["status"] == "published"
-        content = engine._load_content()
-        post = next(c for c in content if c["content_id"] == "social-posts-post-1")
+        content = primed._load_content()
+        post = _index(content)["social-posts-post-1"]
         assert post["status"] == "published"
         assert post["url"] == "https://twitter.com/post/1"
 
-    def test_unknown_id_error(self, engine, multi_post_file):
-        engine.discover_content()
-        result = engine.update_metrics("nonexistent-id", {"impressions": 100})
+    def test_unknown_id_error(self, primed):
+        result = primed.update_metrics("nonexistent-id", {"impressions": 100})
         assert result["success"] is False
         assert "Unknown" in result["error"]
 
-    def test_partial_update(self, engine, multi_post_file):
-        engine.discover_content()
-        engine.update_metrics("social-posts-post-1", {"impressions": 5000})
-        engine.update_metrics("social-posts-post-1", {"engagements": 200})
-        content = engine._load_content()
-        post = next(c for c in content if c["content_id"] == "social-posts-post-1")
+    def test_partial_update(self, primed):
+        primed.update_metrics("social-posts-post-1", {"impressions": 5000})
+        primed.update_metrics("social-posts-post-1", {"engagements": 200})
+        content = primed._load_content()
+        post = _index(content)["social-posts-post-1"]
         assert post["metrics"]["impressions"] == 5000
         assert post["metrics"]["engagements"] == 200
@@ -1,3 +1,5 @@
+import pytest
+
 from multi_agent_performance import MultiAgentPerformanceOptimizer
 
 
@@ -64,9 +66,8 @@ class TestMultiAgentPerformanceOptimizer:
             {"accuracy": 0.45, "efficiency": 0.40, "adaptability": 0.35},
         ]
 
-        for agent_details, perf_data in zip(agents, performance_data, strict=True):
-            agent_id = self.optimizer.register_agent(agent_details)
-            self.optimizer.update_agent_performance(agent_id, perf_data)
+        agent_ids = self.optimizer.register_agents(agents)
+        self.optimizer.update_performance_many(agent_ids, performance_data)
 
         # Get top performers
         top_agents = self.optimizer.get_top_performing_agents(2)
@@ -75,6 +76,17 @@ class TestMultiAgentPerformanceOptimizer:
         assert top_agents[0]["name"] == "Agent A"
         assert top_agents[1]["name"] == "Agent B"
 
+    def test_top_performing_agents_ties_keep_registration_order(self):
+        agent_ids = self.optimizer.register_agents(
+            [{"name": name, "capabilities": []} for name in ("First", "Second", "Third")]
+        )
+        same = {"accuracy": 0.9, "efficiency": 0.9, "adaptability": 0.9}
+        self.optimizer.update_performance_many(agent_ids, [same, same, same])
+
+        top_agents = self.optimizer.get_top_performing_agents(2)
+
+        assert [a["name"] for a in top_agents] == ["First", "Second"]
+
     def test_performance_report_generation(self):
         # Populate with some agents
         agents = [
@@ -87,9 +99,8 @@ class TestMultiAgentPerformanceOptimizer:
             {"accuracy": 0.55, "efficiency": 0.50, "adaptability": 0.45},
         ]
 
-        for agent_details, perf_data in zip(agents, performance_data, strict=True):
-            agent_id = self.optimizer.register_agent(agent_details)
-            self.optimizer.update_agent_performance(agent_id, perf_data)
+        agent_ids = self.optimizer.register_agents(agents)
+        self.optimizer.update_performance_many(agent_ids, performance_data)
 
         # Generate performance report
         report = self.optimizer.generate_performance_report()
@@ -98,3 +109,23 @@ class TestMultiAgentPerformanceOptimizer:
         assert "average_performance" in report
         assert "top_performers" in report
         assert "performance_trends" in report
+
+    def test_update_performance_many_rejects_unknown_id(self):
+        agent_ids = self.optimizer.register_agents([{"name": "Known", "capabilities": []}])
+        performance_data = [
+            {"accuracy": 0.9, "efficiency": 0.9, "adaptability": 0.9},
+            {"accuracy": 0.9, "efficiency": 0.9, "adaptability": 0.9},
+        ]
+
+        with pytest.raises(ValueError):
+            self.optimizer.update_performance_many(agent_ids + ["missing"], performance_data)
+
+        # Validation happens up front, so the known agent is untouched
+        assert self.optimizer.agents[agent_ids[0]]["performance_score"] == 0.0
+        assert self.optimizer.performance_history == []
+
+    def test_performance_report_not_shared_between_calls(self):
+        self.optimizer.register_agents([{"name": "Solo", "capabilities": []}])
+        first = self.optimizer.generate_performance_report()
+        first["top_performers"].clear()
+        assert len(self.optimizer.generate_performance_report()["top_performers"]) == 1
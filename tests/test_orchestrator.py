@@ -2,9 +2,35 @@
 
 import json
 import os
+from types import SimpleNamespace
+
+import pytest
 
 from orchestrator import SelfOptimizationOrchestrator, StateManager
 
+
+@pytest.fixture()
+def dirs(tmp_path):
+    """Orchestrator dirs under tmp_path, as ready-made strings plus Paths.
+
+    The workspace exists (empty); the state dir is left for the orchestrator to create.
+    """
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    state = tmp_path / "state"
+    return SimpleNamespace(
+        state=str(state), workspace=str(workspace), state_path=state, workspace_path=workspace
+    )
+
+
+def _bare_orchestrator(workspace_dir):
+    """An orchestrator with just its workspace and daemon flag set; skips __init__."""
+    orch = object.__new__(SelfOptimizationOrchestrator)
+    orch.workspace_dir = workspace_dir
+    orch._daemon_running = False
+    return orch
+
+
 # ── StateManager ────────────────────────────────────────────────────────
 
 
@@ -34,6 +60,47 @@ class TestStateManager:
         (tmp_path / "bad.json").write_text("not json{{{")
         assert sm.load("bad", default="fallback") == "fallback"
 
+    def test_load_non_utf8_returns_default(self, tmp_path):
+        sm = StateManager(str(tmp_path))
+        (tmp_path / "binary.json").write_bytes(b"\xff\xfe\x00")
+        assert sm.load("binary", default="fallback") == "fallback"
+
+    def test_unchanged_save_skips_rewrite(self, tmp_path):
+        sm = StateManager(str(tmp_path))
+        sm.save("k", {"a": 1})
+        inode = os.stat(tmp_path / "k.json").st_ino
+        sm.save("k", {"a": 1})
+        assert os.stat(tmp_path / "k.json").st_ino == inode
+        sm.save("k", {"a": 2})
+        assert os.stat(tmp_path / "k.json").st_ino != inode
+        assert sm.load("k") == {"a": 2}
+
+    def test_unchanged_save_restores_externally_changed_file(self, tmp_path):
+        sm = StateManager(str(tmp_path))
+        sm.save("k", {"a": 1})
+        os.remove(tmp_path / "k.json")
+        sm.save("k", {"a": 1})
+        assert sm.load("k") == {"a": 1}
+
+        (tmp_path / "k.json").write_text('{"a": 99}')
+        sm.save("k", {"a": 1})
+        assert sm.load("k") == {"a": 1}
+
+    def test_failed_save_keeps_previous_state(self, tmp_path, monkeypatch):
+        sm = StateManager(str(tmp_path))
+        sm.save("k", {"a": 1})
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            sm.save("k", {"a": 2})
+        monkeypatch.undo()
+
+        assert sm.load("k") == {"a": 1}
+        assert not (tmp_path / "k.json.tmp").exists()
+
     def test_creates_directory_if_missing(self, tmp_path):
         state_dir = str(tmp_path / "new" / "nested" / "dir")
         sm = StateManager(state_dir)
@@ -45,28 +112,32 @@ class TestStateManager:
 
 
 class TestOrchestratorInit:
-    def test_creates_all_four_systems(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+    def test_creates_all_four_systems(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         assert orch.anti_idling is not None
         assert orch.performance is not None
         assert orch.improvement is not None
         assert orch.verification is not None
 
-    def test_creates_scanner_and_llm(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+    def test_creates_scanner_and_llm(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         assert orch.scanner is not None
         assert orch.llm is not None
 
-    def test_registers_agent(self, tmp_path):
+    def test_subsystems_built_on_first_access(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
+        assert "scanner" not in orch.__dict__
+        scanner = orch.scanner
+        assert orch.scanner is scanner
+        assert scanner.workspace_dir == dirs.workspace
+        # cached_property stores the built value in the instance __dict__
+        assert "scanner" in orch.__dict__
+        assert "llm" not in orch.__dict__
+
+    def test_registers_agent(self, dirs):
         orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
+            state_dir=dirs.state,
+            workspace_dir=dirs.workspace,
             agent_id="test-agent",
         )
         assert orch.agent_id == "test-agent"
@@ -74,11 +145,8 @@ class TestOrchestratorInit:
         assert len(orch.performance.agents) >= 1
         assert "test-agent" in orch._agent_ids
 
-    def test_default_agent_id(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+    def test_default_agent_id(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         assert orch.agent_id == "loopy-0"
 
 
@@ -86,13 +154,8 @@ class TestOrchestratorInit:
 
 
 class TestIdleCheck:
-    def test_idle_check_returns_expected_keys(self, tmp_path):
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(workspace),
-        )
+    def test_idle_check_returns_expected_keys(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         result = orch.idle_check()
         assert "timestamp" in result
         assert "idle_rate" in result
@@ -102,42 +165,26 @@ class TestIdleCheck:
         assert "activities_found" in result
         assert "service_health" in result
 
-    def test_idle_check_detects_files(self, tmp_path):
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        (workspace / "work.py").write_text("print('hello')")
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(workspace),
-        )
+    def test_idle_check_detects_files(self, dirs):
+        (dirs.workspace_path / "work.py").write_text("print('hello')")
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         result = orch.idle_check()
         assert result["activities_found"] >= 1
 
-    def test_idle_check_persists_state(self, tmp_path):
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        state_dir = tmp_path / "state"
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(state_dir),
-            workspace_dir=str(workspace),
-        )
+    def test_idle_check_persists_state(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         orch.idle_check()
-        assert (state_dir / "last_run.json").exists()
-        assert (state_dir / "activity_log.json").exists()
+        assert (dirs.state_path / "last_run.json").exists()
+        assert (dirs.state_path / "activity_log.json").exists()
 
 
 # ── Daily Review ────────────────────────────────────────────────────────
 
 
 class TestDailyReview:
-    def test_daily_review_returns_expected_keys(self, tmp_path):
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        (workspace / "memory" / "daily-reflections").mkdir(parents=True)
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(workspace),
-        )
+    def test_daily_review_returns_expected_keys(self, dirs):
+        (dirs.workspace_path / "memory" / "daily-reflections").mkdir(parents=True)
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         result = orch.daily_review()
         assert "timestamp" in result
         assert "date" in result
@@ -147,13 +194,18 @@ class TestDailyReview:
         assert "reflection_path" in result
         assert "verification" in result
 
-    def test_daily_review_writes_reflection_file(self, tmp_path):
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(workspace),
-        )
+    def test_activity_log_drops_parsed_reflections(self, dirs):
+        reflections = dirs.workspace_path / "memory" / "daily-reflections"
+        reflections.mkdir(parents=True)
+        (reflections / "2026-01-01.md").write_text("## Achievements\n- shipped\n")
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
+        orch.idle_check()
+        logged = [a for a in orch.anti_idling.activity_log if a["type"] == "daily_reflection"]
+        assert logged
+        assert all("parsed" not in a for a in logged)
+
+    def test_daily_review_writes_reflection_file(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         result = orch.daily_review()
         assert result["reflection_path"]
         assert os.path.isfile(result["reflection_path"])
@@ -161,13 +213,8 @@ class TestDailyReview:
             content = f.read()
         assert "Daily Reflection" in content
 
-    def test_daily_review_runs_verification(self, tmp_path):
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(workspace),
-        )
+    def test_daily_review_runs_verification(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         result = orch.daily_review()
         assert "specific" in result["verification"]
 
@@ -176,30 +223,36 @@ class TestDailyReview:
 
 
 class TestStatePersistence:
-    def test_state_roundtrip(self, tmp_path):
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        state_dir = str(tmp_path / "state")
-
+    def test_state_roundtrip(self, dirs):
         # Create orchestrator and add some data
-        orch1 = SelfOptimizationOrchestrator(state_dir=state_dir, workspace_dir=str(workspace))
+        orch1 = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         orch1.anti_idling.log_activity({"type": "coding", "is_productive": True, "duration": 3600})
         orch1._persist_state()
 
         # Create new orchestrator and verify state restored
-        orch2 = SelfOptimizationOrchestrator(state_dir=state_dir, workspace_dir=str(workspace))
+        orch2 = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         assert len(orch2.anti_idling.activity_log) >= 1
 
+    def test_restored_activity_log_stays_bounded(self, dirs):
+        state_dir = dirs.state_path
+        state_dir.mkdir()
+        entries = [{"type": f"action_{i}", "timestamp": 0.0} for i in range(150)]
+        (state_dir / "activity_log.json").write_text(json.dumps(entries))
+
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
+        assert len(orch.anti_idling.activity_log) == 100
+        assert orch.anti_idling.activity_log[0]["type"] == "action_50"
+
+        orch.anti_idling.log_activity({"type": "new"})
+        assert len(orch.anti_idling.activity_log) == 100
+
 
 # ── Status ──────────────────────────────────────────────────────────────
 
 
 class TestStatus:
-    def test_status_returns_expected_keys(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+    def test_status_returns_expected_keys(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         status = orch.status()
         assert "agent_id" in status
         assert "workspace_dir" in status
@@ -211,11 +264,8 @@ class TestStatus:
         assert "daemon_running" in status
         assert "service_health" in status
 
-    def test_status_includes_service_health(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+    def test_status_includes_service_health(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         status = orch.status()
         # Service health should include gateway, enterprise, and vite-ui
         health = status["service_health"]
@@ -225,11 +275,22 @@ class TestStatus:
             assert "healthy" in h
             assert "port" in h
 
-    def test_status_daemon_not_running(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
+    def test_status_reuses_recent_service_probes(self, dirs, monkeypatch):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
+        calls = []
+        monkeypatch.setattr(
+            orch.watchdog, "check_all_services", lambda: calls.append(1) or {"gateway": {}}
         )
+        assert orch.status()["service_health"] == {"gateway": {}}
+        orch.status()
+        assert len(calls) == 1
+
+        orch._health_cache = (0.0, {})  # expired
+        orch.status()
+        assert len(calls) == 2
+
+    def test_status_daemon_not_running(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         assert orch.status()["daemon_running"] is False
 
 
@@ -237,11 +298,8 @@ class TestStatus:
 
 
 class TestLogActivity:
-    def test_log_activity_adds_to_anti_idling(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+    def test_log_activity_adds_to_anti_idling(self, dirs):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         orch.log_activity({"type": "test", "is_productive": True, "duration": 60})
         assert len(orch.anti_idling.activity_log) >= 1
 
@@ -250,26 +308,29 @@ class TestLogActivity:
 
 
 class TestStopDaemon:
-    def test_stop_daemon_sets_flag(self, tmp_path):
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+    def test_stop_daemon_sets_flag(self, dirs):
+        orch = _bare_orchestrator(dirs.workspace)
         orch._daemon_running = True
         orch.stop_daemon()
         assert orch._daemon_running is False
 
+    def test_close_releases_llm_connection(self, dirs, monkeypatch):
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
+        orch.close()  # nothing built yet
+        assert "llm" not in orch.__dict__
+        closed = []
+        monkeypatch.setattr(orch.llm, "close", lambda: closed.append(True))
+        orch.close()
+        assert closed == [True]
+
 
 # ── Action Handler Wiring ──────────────────────────────────────────────
 
 
 class TestActionHandlerWiring:
-    def test_action_handlers_registered_on_init(self, tmp_path):
+    def test_action_handlers_registered_on_init(self, dirs):
         """Orchestrator registers action handlers for all 5 emergency actions."""
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         expected_actions = [
             "conduct_strategic_analysis",
             "explore_new_skill_development",
@@ -280,13 +341,11 @@ class TestActionHandlerWiring:
         for action in expected_actions:
             assert action in orch.anti_idling.action_handlers
 
-    def test_idle_check_dispatches_actions(self, tmp_path):
+    def test_idle_check_dispatches_actions(self, dirs):
         """idle_check populates actions_executed when idle rate exceeds threshold."""
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
         orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(workspace),
+            state_dir=dirs.state,
+            workspace_dir=dirs.workspace,
             idle_threshold=0.01,  # very low threshold → always triggers
         )
         result = orch.idle_check()
@@ -294,13 +353,11 @@ class TestActionHandlerWiring:
         assert len(result["actions_proposed"]) > 0
         assert len(result["actions_executed"]) > 0
 
-    def test_idle_check_actions_executed_updates_capability_map(self, tmp_path):
+    def test_idle_check_actions_executed_updates_capability_map(self, dirs):
         """Dispatched actions update capability_map via execute_improvement."""
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
         orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(workspace),
+            state_dir=dirs.state,
+            workspace_dir=dirs.workspace,
             idle_threshold=0.01,
         )
         initial_history = len(orch.improvement.improvement_history)
@@ -308,12 +365,9 @@ class TestActionHandlerWiring:
         # execute_improvement should have been called, adding to history
         assert len(orch.improvement.improvement_history) > initial_history
 
-    def test_on_idle_triggered_runs_improvement(self, tmp_path):
+    def test_on_idle_triggered_runs_improvement(self, dirs):
         """_on_idle_triggered executes an improvement proposal when strategies exist."""
-        orch = SelfOptimizationOrchestrator(
-            state_dir=str(tmp_path / "state"),
-            workspace_dir=str(tmp_path / "workspace"),
-        )
+        orch = SelfOptimizationOrchestrator(state_dir=dirs.state, workspace_dir=dirs.workspace)
         # Register a learning strategy that returns a valid proposal
         orch.improvement.learning_strategies.append(
             lambda cap_map, gaps: [
@@ -1,32 +1,57 @@
+import pytest
+
 from recursive_self_improvement import RecursiveSelfImprovementProtocol
 
+# Custom ethical constraints every fixture protocol is built with
+_CONSTRAINTS = {
+    "do_no_harm": True,
+    "human_alignment": True,
+    "transparency": True,
+    "reversibility": True,
+}
 
-class TestRecursiveSelfImprovementProtocol:
-    def setup_method(self):
-        # Initialize with custom ethical constraints
-        self.protocol = RecursiveSelfImprovementProtocol(
-            {
-                "do_no_harm": True,
-                "human_alignment": True,
-                "transparency": True,
-                "reversibility": True,
-            }
-        )
 
-    def test_capability_map_update(self):
+@pytest.fixture(scope="module")
+def shared_protocol():
+    """Built once per module; only for tests that never mutate it."""
+    return RecursiveSelfImprovementProtocol(dict(_CONSTRAINTS))
+
+
+@pytest.fixture()
+def protocol():
+    """Fresh protocol for tests that mutate it."""
+    return RecursiveSelfImprovementProtocol(dict(_CONSTRAINTS))
+
+
+class TestRecursiveSelfImprovementProtocol:
+    def test_capability_map_update(self, protocol):
         new_capabilities = {
             "advanced_reasoning": {"complexity": "high", "domain": "cognitive_enhancement"},
             "ethical_decision_making": {"complexity": "medium", "domain": "governance"},
         }
 
-        self.protocol.update_capability_map(new_capabilities)
+        protocol.update_capability_map(new_capabilities)
 
         # Check capability registration
         for capability, _details in new_capabilities.items():
-            assert capability in self.protocol.capability_map
-            assert "added_timestamp" in self.protocol.capability_map[capability]
+            assert capability in protocol.capability_map
+            assert "added_timestamp" in protocol.capability_map[capability]
+
+    def test_capability_map_update_shares_timestamp(self, protocol):
+        protocol.update_capability_map(
+            {
+                "a": {"complexity": "low"},
+                "b": {"complexity": "low"},
+                "c": {"added_timestamp": "2025-01-01T00:00:00"},
+            }
+        )
 
-    def test_learning_strategy_registration(self):
+        cap_map = protocol.capability_map
+        assert cap_map["a"]["added_timestamp"] == cap_map["b"]["added_timestamp"]
+        # An explicit timestamp in the details still wins
+        assert cap_map["c"]["added_timestamp"] == "2025-01-01T00:00:00"
+
+    def test_learning_strategy_registration(self, protocol):
         def mock_learning_strategy(capability_map, capability_gaps):
             # Simulate learning strategy
             return [
@@ -41,15 +66,15 @@ class TestRecursiveSelfImprovementProtocol:
             ]
 
         # Register learning strategy
-        self.protocol.register_learning_strategy(mock_learning_strategy)
+        protocol.register_learning_strategy(mock_learning_strategy)
 
         # Generate improvement proposals
-        proposals = self.protocol.generate_improvement_proposals()
+        proposals = protocol.generate_improvement_proposals()
 
         assert len(proposals) > 0
         assert all("type" in proposal for proposal in proposals)
 
-    def test_proposal_validation(self):
+    def test_proposal_validation(self, shared_protocol):
         # Test proposals with different ethical constraints
         valid_proposal = {
             "meets_do_no_harm": True,
@@ -61,13 +86,13 @@ class TestRecursiveSelfImprovementProtocol:
         invalid_proposal = {"meets_do_no_harm": False, "meets_human_alignment": False}
 
         # Validate proposals
-        valid_result = self.protocol._validate_proposal(valid_proposal)
-        invalid_result = self.protocol._validate_proposal(invalid_proposal)
+        valid_result = shared_protocol._validate_proposal(valid_proposal)
+        invalid_result = shared_protocol._validate_proposal(invalid_proposal)
 
         assert valid_result is True
         assert invalid_result is False
 
-    def test_improvement_execution(self):
+    def test_improvement_execution(self, protocol):
         # Prepare a valid improvement proposal
         improvement_proposal = {
             "type": "capability_enhancement",
@@ -78,23 +103,23 @@ class TestRecursiveSelfImprovementProtocol:
         }
 
         # Execute improvement
-        self.protocol.execute_improvement(improvement_proposal)
+        protocol.execute_improvement(improvement_proposal)
 
         # Check improvement history
-        assert len(self.protocol.improvement_history) > 0
-        latest_log = self.protocol.improvement_history[-1]
+        assert len(protocol.improvement_history) > 0
+        latest_log = protocol.improvement_history[-1]
         assert latest_log["type"] == "proposal_execution"
 
-    def test_improvement_report_generation(self):
+    def test_improvement_report_generation(self, protocol):
         # Simulate some improvements
         improvements = [{"type": "capability_update"}, {"type": "performance_optimization"}]
 
         # Manually add improvements to history
         for improvement in improvements:
-            self.protocol._log_improvement(improvement["type"], {"details": "Test improvement"})
+            protocol._log_improvement(improvement["type"], {"details": "Test improvement"})
 
         # Generate improvement report
-        report = self.protocol.generate_improvement_report()
+        report = protocol.generate_improvement_report()
 
         # Verify report structure
         assert "total_improvements" in report
@@ -113,3 +138,43 @@ class TestRecursiveSelfImprovementProtocol:
         # Validate custom constraint handling
         assert "innovation_priority" in custom_protocol.ethical_constraints
         assert "risk_tolerance" in custom_protocol.ethical_constraints
+
+    def test_validation_ignores_constraints_not_required(self):
+        protocol = RecursiveSelfImprovementProtocol({"do_no_harm": True, "transparency": False})
+
+        assert protocol._validate_proposal({"meets_do_no_harm": True}) is True
+        assert protocol._validate_proposal({"meets_transparency": True}) is False
+
+    def test_validation_follows_replaced_constraints(self, protocol):
+        proposal = {"meets_do_no_harm": True}
+        assert protocol._validate_proposal(proposal) is False
+
+        protocol.ethical_constraints = {"do_no_harm": True}
+        assert protocol._validate_proposal(proposal) is True
+
+    def test_validation_follows_constraints_edited_in_place(self, protocol):
+        proposal = {
+            "meets_do_no_harm": True,
+            "meets_human_alignment": True,
+            "meets_transparency": True,
+            "meets_reversibility": True,
+        }
+        assert protocol._validate_proposal(proposal) is True
+
+        protocol.ethical_constraints["new_rule"] = True
+        assert protocol._validate_proposal(proposal) is False
+
+        protocol.ethical_constraints["new_rule"] = False
+        assert protocol._validate_proposal(proposal) is True
+
+    def test_improvement_report_counts_types(self, protocol):
+        for imp_type in ["capability_update", "performance_optimization", "capability_update"]:
+            protocol._log_improvement(imp_type, {})
+
+        report = protocol.generate_improvement_report()
+
+        assert report["total_improvements"] == 3
+        assert report["improvement_types"] == {
+            "capability_update": 2,
+            "performance_optimization": 1,
+        }
@@ -1,11 +1,16 @@
+import pytest
+
 from results_verification import ResultsVerificationFramework
 
 
-class TestResultsVerificationFramework:
-    def setup_method(self):
-        self.verifier = ResultsVerificationFramework()
+@pytest.fixture()
+def verifier():
+    """Fresh verifier per test (every test here records history)."""
+    return ResultsVerificationFramework()
 
-    def test_verification_criteria(self):
+
+class TestResultsVerificationFramework:
+    def test_verification_criteria(self, verifier):
         # Test a fully valid result
         results = {
             "project_name": "Test Project",
@@ -15,42 +20,42 @@ class TestResultsVerificationFramework:
             "components": ["feature1", "feature2"],
         }
 
-        verification_results = self.verifier.verify_results(results)
+        verification_results = verifier.verify_results(results)
 
         # All criteria should pass
         assert all(verification_results.values()), f"Verification failed: {verification_results}"
 
-    def test_custom_verification_criterion(self):
+    def test_custom_verification_criterion(self, verifier):
         def custom_check(results):
             return "custom_key" in results
 
-        self.verifier.add_custom_verification_criterion("has_custom_key", custom_check)
+        verifier.add_custom_verification_criterion("has_custom_key", custom_check)
 
         results = {"project_name": "Custom Test", "custom_key": True}
 
-        verification_results = self.verifier.verify_results(results)
+        verification_results = verifier.verify_results(results)
         assert verification_results.get("has_custom_key", False)
 
-    def test_verification_history(self):
+    def test_verification_history(self, verifier):
         results1 = {"project_name": "Project A", "output": 100, "next_step": "Proceed"}
         results2 = {"project_name": "Project B", "output": 200, "details": {"complexity": "high"}}
 
-        self.verifier.verify_results(results1)
-        self.verifier.verify_results(results2)
+        verifier.verify_results(results1)
+        verifier.verify_results(results2)
 
-        assert len(self.verifier.verification_history) == 2
+        assert len(verifier.verification_history) == 2
 
         # Check success rate calculation
-        success_rate = self.verifier.get_verification_success_rate()
+        success_rate = verifier.get_verification_success_rate()
         assert 0 <= success_rate <= 100
 
-    def test_export_verification_history(self, tmp_path):
+    def test_export_verification_history(self, verifier, tmp_path):
         results = {"project_name": "Export Test", "output": 50, "next_step": "Review"}
 
-        self.verifier.verify_results(results)
+        verifier.verify_results(results)
 
         export_file = tmp_path / "verification_history.json"
-        self.verifier.export_verification_history(str(export_file))
+        verifier.export_verification_history(str(export_file))
 
         assert export_file.exists()
         assert export_file.stat().st_size > 0
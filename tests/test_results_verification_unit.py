@@ -5,403 +5,442 @@ Tests each method in isolation, covering happy paths, edge cases,
 and verified bug fixes.
 """
 
+import inspect
 import json
 import os
+import random
+import stat
+from itertools import chain, repeat
+from operator import attrgetter
 
 import pytest
 
 from results_verification import ResultsVerificationFramework
 
-# ── Constructor ──────────────────────────────────────────────────────────
 
+@pytest.fixture(scope="module")
+def fw_with_one_history():
+    """Shared framework holding one recorded verification; do not mutate."""
+    fw = ResultsVerificationFramework()
+    fw.verify_results({"a": 1, "b": 2})
+    return fw
 
-class TestVerificationInit:
-    def test_default_criteria_count(self):
-        fw = ResultsVerificationFramework()
-        assert len(fw.verification_criteria) == 5
 
-    def test_default_criteria_names(self):
-        fw = ResultsVerificationFramework()
-        expected = {"specific", "measurable", "actionable", "reusable", "compoundable"}
-        assert set(fw.verification_criteria.keys()) == expected
+# Success rate, as a percentage, of a history where two in three verifications passed
+_TWO_THIRDS = 200 / 3
 
-    def test_empty_history(self):
-        fw = ResultsVerificationFramework()
-        assert fw.verification_history == []
 
-    def test_criteria_are_callable(self):
-        fw = ResultsVerificationFramework()
-        for func in fw.verification_criteria.values():
-            assert callable(func)
+@pytest.fixture()
+def make_fw():
+    """Factory for frameworks with an injected history of valid/invalid entries."""
 
-    def test_default_max_history(self):
-        fw = ResultsVerificationFramework()
-        assert fw.max_history == 1000
+    def _make(valids, invalids):
+        # Room for every injected entry: assigned histories are capped at max_history
+        fw = ResultsVerificationFramework(max_history=max(1000, valids + invalids))
+        # One shared dict per outcome, laid out in a single pass
+        valid, invalid = {"overall_valid": True}, {"overall_valid": False}
+        fw.verification_history = chain(repeat(valid, valids), repeat(invalid, invalids))
+        return fw
 
-    def test_custom_max_history(self):
-        fw = ResultsVerificationFramework(max_history=50)
-        assert fw.max_history == 50
+    return _make
 
 
-# ── _check_specificity ───────────────────────────────────────────────────
+@pytest.fixture(scope="module")
+def exported_history_path(fw_with_one_history, tmp_path_factory):
+    """Export of fw_with_one_history, written once per module; read-only."""
+    path = tmp_path_factory.mktemp("export") / "history.json"
+    fw_with_one_history.export_verification_history(os.fspath(path))
+    return path
 
 
-class TestCheckSpecificity:
-    def test_valid_results(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({"key": "value"}) is True
+@pytest.fixture(scope="module")
+def fw_all_good():
+    """Shared framework whose three recorded verifications all passed; do not mutate."""
+    fw = ResultsVerificationFramework()
+    for _ in range(3):
+        fw.verify_results({"next_step": "deploy", "score": 95, "items": [1, 2, 3]})
+    return fw
 
-    def test_none_results(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity(None) is False
 
-    def test_empty_dict(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({}) is False
+def _random_results(rng, count):
+    """Yield ``count`` seeded random result dicts mixing scalars, containers and None."""
+    values = [
+        lambda: rng.randint(-100, 100),
+        lambda: rng.random(),
+        lambda: rng.choice(["", "text", "0"]),
+        lambda: rng.random() < 0.5,
+        lambda: None,
+        lambda: [rng.randint(0, 9)] * rng.randint(0, 2),
+        lambda: {"nested": rng.randint(0, 9)},
+    ]
+    for _ in range(count):
+        size = rng.randint(1, 5)
+        yield {f"k{i}": rng.choice(values)() for i in range(size)}
 
-    def test_zero_value_accepted(self):
-        """Zero is a valid value — no longer rejected."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({"score": 0}) is True
 
-    def test_empty_string_accepted(self):
-        """Empty string is accepted (not None)."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({"name": ""}) is True
+def _bad_check(results):
+    raise ValueError("intentional")
 
-    def test_empty_list_accepted(self):
-        """Empty list is accepted (not None)."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({"items": []}) is True
 
-    def test_none_value_rejected(self):
-        """None values are rejected by specificity."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({"key": None}) is False
+@pytest.fixture()
+def fw_with_bad_criterion(fw_rw):
+    """Fresh framework with a criterion named "bad" that always raises."""
+    fw_rw.add_custom_verification_criterion("bad", _bad_check)
+    return fw_rw
 
-    def test_multiple_truthy_values(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({"a": 1, "b": "text", "c": [1]}) is True
 
-    def test_mixed_with_none(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity({"a": 1, "b": None}) is False
+@pytest.fixture(scope="module")
+def export_sig():
+    return inspect.signature(ResultsVerificationFramework.export_verification_history)
 
-    def test_non_dict_input(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_specificity("string") is False
-        assert fw._check_specificity([1, 2]) is False
-        assert fw._check_specificity(42) is False
 
+# ── Constructor ──────────────────────────────────────────────────────────
 
-# ── _check_measurability ────────────────────────────────────────────────
 
+class TestVerificationInit:
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("max_history", 1000),
+            ("verification_history.maxlen", 1000),
+        ],
+    )
+    def test_default_attrs(self, fw_ro, attr, expected):
+        assert attrgetter(attr)(fw_ro) == expected
+
+    def test_empty_history(self, fw_ro):
+        assert list(fw_ro.verification_history) == []
+
+    def test_criteria_shape(self, fw_ro):
+        expected = {"specific", "measurable", "actionable", "reusable", "compoundable"}
+        assert set(fw_ro.verification_criteria) == expected
+        assert all(callable(func) for func in fw_ro.verification_criteria.values())
 
-class TestCheckMeasurability:
-    def test_all_numeric(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"a": 1, "b": 2.5}) is True
+    def test_custom_max_history(self):
+        fw = ResultsVerificationFramework(max_history=50)
+        assert fw.max_history == 50
+        assert fw.verification_history.maxlen == 50
 
-    def test_all_strings(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"a": "hello", "b": "world"}) is True
+    @pytest.mark.parametrize("max_history", [0, -1])
+    def test_non_positive_max_history_rejected(self, max_history):
+        with pytest.raises(ValueError, match="max_history must be >= 1"):
+            ResultsVerificationFramework(max_history=max_history)
 
-    def test_mixed_numeric_and_string(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"a": 1, "b": "text"}) is True
 
-    def test_contains_list_with_scalar(self):
-        """Mixed types: has scalar, so measurable passes with any()."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"a": 1, "b": [1, 2, 3]}) is True
+# ── _check_specificity ───────────────────────────────────────────────────
 
-    def test_only_list(self):
-        """All complex: no scalar, measurable fails."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"a": [1, 2, 3]}) is False
 
-    def test_only_dict(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"a": {"nested": True}}) is False
+class TestCheckSpecificity:
+    @pytest.mark.parametrize(
+        ("results", "expected"),
+        [
+            pytest.param({"key": "value"}, True, id="valid"),
+            pytest.param(None, False, id="none"),
+            # Zero, "" and [] are real values — only None is rejected
+            pytest.param({"score": 0}, True, id="zero"),
+            pytest.param({"name": ""}, True, id="empty-string"),
+            pytest.param({"items": []}, True, id="empty-list"),
+            pytest.param({"key": None}, False, id="none-value"),
+            pytest.param({"a": 1, "b": "text", "c": [1]}, True, id="multiple-truthy"),
+            pytest.param({"a": 1, "b": None}, False, id="mixed-with-none"),
+            pytest.param("string", False, id="non-dict-str"),
+            pytest.param([1, 2], False, id="non-dict-list"),
+            pytest.param(42, False, id="non-dict-int"),
+        ],
+    )
+    def test_specificity(self, fw_ro, results, expected):
+        assert fw_ro._check_specificity(results) is expected
 
-    def test_contains_bool(self):
-        """bool is subclass of int, so isinstance(True, int) is True."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"flag": True}) is True
 
-    def test_contains_none(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({"a": None}) is False
+# ── _check_measurability ────────────────────────────────────────────────
 
-    def test_empty_dict_returns_false(self):
-        """Empty dict now returns False (guard added)."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_measurability({}) is False
+
+class TestCheckMeasurability:
+    @pytest.mark.parametrize(
+        ("results", "expected"),
+        [
+            pytest.param({"a": 1, "b": 2.5}, True, id="all-numeric"),
+            pytest.param({"a": "hello", "b": "world"}, True, id="all-strings"),
+            pytest.param({"a": 1, "b": "text"}, True, id="numeric-and-string"),
+            # any(): one scalar is enough, all-complex fails
+            pytest.param({"a": 1, "b": [1, 2, 3]}, True, id="list-with-scalar"),
+            pytest.param({"a": [1, 2, 3]}, False, id="only-list"),
+            pytest.param({"a": {"nested": True}}, False, id="only-dict"),
+            # bool is a subclass of int
+            pytest.param({"flag": True}, True, id="bool"),
+            pytest.param({"a": None}, False, id="none"),
+        ],
+    )
+    def test_measurability(self, fw_ro, results, expected):
+        assert fw_ro._check_measurability(results) is expected
+
+
+class TestCriteriaProperties:
+    """Invariants checked over many generated inputs, alongside the tables above."""
+
+    def test_specificity_and_measurability_invariants(self, fw_ro):
+        for results in _random_results(random.Random(0), 500):
+            values = results.values()
+            assert fw_ro._check_specificity(results) is all(v is not None for v in values)
+            assert fw_ro._check_measurability(results) is any(
+                isinstance(v, (int, float, str)) for v in values
+            )
 
 
 # ── _check_actionability ────────────────────────────────────────────────
 
 
 class TestCheckActionability:
-    def test_with_next_step(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_actionability({"next_step": "do something"}) is True
-
-    def test_with_recommendation(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_actionability({"recommendation": "do this"}) is True
-
-    def test_with_both_keys(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_actionability({"next_step": "x", "recommendation": "y"}) is True
-
-    def test_without_action_keys(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_actionability({"data": "value"}) is False
-
-    def test_empty_dict(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_actionability({}) is False
+    @pytest.mark.parametrize(
+        ("results", "expected"),
+        [
+            pytest.param({"next_step": "do something"}, True, id="next-step"),
+            pytest.param({"recommendation": "do this"}, True, id="recommendation"),
+            pytest.param({"next_step": "x", "recommendation": "y"}, True, id="both"),
+            pytest.param({"data": "value"}, False, id="no-action-keys"),
+        ],
+    )
+    def test_actionability(self, fw_ro, results, expected):
+        assert fw_ro._check_actionability(results) is expected
 
 
 # ── _check_reusability ──────────────────────────────────────────────────
 
 
 class TestCheckReusability:
-    def test_multiple_keys(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_reusability({"a": 1, "b": 2}) is True
-
-    def test_single_key(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_reusability({"a": 1}) is False
-
-    def test_empty_dict(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_reusability({}) is False
-
-    def test_exactly_two_keys(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_reusability({"a": 1, "b": 2}) is True
+    @pytest.mark.parametrize(
+        ("results", "expected"),
+        [
+            pytest.param({"a": 1, "b": 2, "c": 3}, True, id="multiple-keys"),
+            pytest.param({"a": 1, "b": 2}, True, id="exactly-two-keys"),
+            pytest.param({"a": 1}, False, id="single-key"),
+        ],
+    )
+    def test_reusability(self, fw_ro, results, expected):
+        assert fw_ro._check_reusability(results) is expected
 
 
 # ── _check_compoundability ──────────────────────────────────────────────
 
 
 class TestCheckCompoundability:
-    def test_with_list_value(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_compoundability({"items": [1, 2]}) is True
+    @pytest.mark.parametrize(
+        ("results", "expected"),
+        [
+            pytest.param({"items": [1, 2]}, True, id="list-value"),
+            pytest.param({"nested": {"a": 1}}, True, id="dict-value"),
+            pytest.param({"a": 1, "b": "text"}, False, id="only-scalars"),
+        ],
+    )
+    def test_compoundability(self, fw_ro, results, expected):
+        assert fw_ro._check_compoundability(results) is expected
+
+    def test_mixed_types_can_satisfy_both_measurable_and_compoundable(self, fw_ro):
+        """With any() for measurability, mixed-type dicts can pass both."""
+        mixed = {"a": 1, "b": [1, 2]}
+        assert fw_ro._check_measurability(mixed) is True  # any scalar → True
+        assert fw_ro._check_compoundability(mixed) is True  # has list → True
 
-    def test_with_dict_value(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_compoundability({"nested": {"a": 1}}) is True
 
-    def test_only_scalars(self):
-        fw = ResultsVerificationFramework()
-        assert fw._check_compoundability({"a": 1, "b": "text"}) is False
+# ── Shared criterion behaviour ──────────────────────────────────────────
 
-    def test_empty_dict(self):
-        """any() on empty iterable returns False."""
-        fw = ResultsVerificationFramework()
-        assert fw._check_compoundability({}) is False
 
-    def test_mixed_types_can_satisfy_both_measurable_and_compoundable(self):
-        """With any() for measurability, mixed-type dicts can pass both."""
-        fw = ResultsVerificationFramework()
-        mixed = {"a": 1, "b": [1, 2]}
-        assert fw._check_measurability(mixed) is True  # any scalar → True
-        assert fw._check_compoundability(mixed) is True  # has list → True
+@pytest.mark.parametrize(
+    "method",
+    [
+        "_check_specificity",
+        "_check_measurability",
+        "_check_actionability",
+        "_check_reusability",
+        "_check_compoundability",
+    ],
+)
+def test_empty_dict_rejected_by_every_criterion(fw_ro, method):
+    assert getattr(fw_ro, method)({}) is False
 
 
 # ── verify_results ──────────────────────────────────────────────────────
 
 
 class TestVerifyResults:
-    def test_basic_verification(self):
-        fw = ResultsVerificationFramework()
+    def test_basic_verification(self, fw_rw):
         results = {"next_step": "do something", "score": 95, "items": [1, 2]}
-        verification = fw.verify_results(results)
+        verification = fw_rw.verify_results(results)
         assert isinstance(verification, dict)
-        assert set(verification.keys()) == set(fw.verification_criteria.keys())
+        assert set(verification.keys()) == set(fw_rw.verification_criteria.keys())
 
-    def test_actionability_works_correctly(self):
+    def test_actionability_works_correctly(self, fw_rw):
         """Actionable returns True when next_step or recommendation is present."""
-        fw = ResultsVerificationFramework()
         results = {"next_step": "act", "recommendation": "do", "items": [1]}
-        verification = fw.verify_results(results)
+        verification = fw_rw.verify_results(results)
         assert verification["actionable"] is True
 
-    def test_overall_valid_can_be_true(self):
+    def test_overall_valid_can_be_true(self, fw_rw):
         """With all bugs fixed, overall_valid=True is now achievable."""
-        fw = ResultsVerificationFramework()
         results = {
             "next_step": "deploy",
             "score": 95,
             "items": [1, 2, 3],
         }
-        fw.verify_results(results)
-        assert fw.verification_history[0]["overall_valid"] is True
-
-    def test_history_recorded(self):
-        fw = ResultsVerificationFramework()
-        fw.verify_results({"a": 1, "b": 2})
-        assert len(fw.verification_history) == 1
-        entry = fw.verification_history[0]
+        fw_rw.verify_results(results)
+        assert fw_rw.verification_history[0]["overall_valid"] is True
+
+    def test_history_recorded(self, fw_rw):
+        fw_rw.verify_results({"a": 1, "b": 2})
+        assert len(fw_rw.verification_history) == 1
+        entry = fw_rw.verification_history[0]
         assert "timestamp" in entry
         assert "results" in entry
         assert "verification_results" in entry
         assert "overall_valid" in entry
 
-    def test_overall_valid_requires_all_pass(self):
-        fw = ResultsVerificationFramework()
-        fw.verify_results({"a": 1, "b": 2})
-        entry = fw.verification_history[0]
+    def test_overall_valid_requires_all_pass(self, fw_rw):
+        fw_rw.verify_results({"a": 1, "b": 2})
+        entry = fw_rw.verification_history[0]
         expected = all(entry["verification_results"].values())
         assert entry["overall_valid"] == expected
 
-    def test_custom_criterion_exception_handled(self):
-        fw = ResultsVerificationFramework()
-
-        def bad_check(results):
-            raise ValueError("intentional")
-
-        fw.add_custom_verification_criterion("bad", bad_check)
-        verification = fw.verify_results({"a": 1})
+    def test_custom_criterion_exception_handled(self, fw_with_bad_criterion):
+        verification = fw_with_bad_criterion.verify_results({"a": 1})
         assert verification["bad"] is False
 
-    def test_empty_results(self):
-        fw = ResultsVerificationFramework()
-        verification = fw.verify_results({})
+    def test_empty_results(self, fw_rw):
+        verification = fw_rw.verify_results({})
         assert verification["specific"] is False
         assert verification["reusable"] is False
 
-    def test_multiple_verifications_accumulate_history(self):
-        fw = ResultsVerificationFramework()
+    @pytest.mark.parametrize("i", range(5))
+    def test_each_verification_appends_one_entry(self, fw_rw, i):
+        results = {"key": f"value_{i}", "other": i + 1}
+        fw_rw.verify_results(results)
+        assert len(fw_rw.verification_history) == 1
+        assert fw_rw.verification_history[-1]["results"] == results
+
+    def test_multiple_verifications_accumulate_history(self, fw_rw):
         for i in range(5):
-            fw.verify_results({"key": f"value_{i}", "other": i + 1})
-        assert len(fw.verification_history) == 5
+            fw_rw.verify_results({"key": f"value_{i}", "other": i + 1})
+        assert len(fw_rw.verification_history) == 5
 
-    def test_rejects_non_dict(self):
-        fw = ResultsVerificationFramework()
-        with pytest.raises(TypeError):
-            fw.verify_results(None)
+    @pytest.mark.parametrize("bad", [None, [1, 2, 3], "string"], ids=["none", "list", "str"])
+    def test_rejects_non_dict(self, fw_ro, bad):
         with pytest.raises(TypeError):
-            fw.verify_results([1, 2, 3])
-        with pytest.raises(TypeError):
-            fw.verify_results("string")
+            fw_ro.verify_results(bad)
 
 
 # ── add_custom_verification_criterion ────────────────────────────────────
 
 
 class TestCustomCriteria:
-    def test_add_custom_criterion(self):
-        fw = ResultsVerificationFramework()
-        fw.add_custom_verification_criterion("custom", lambda r: True)
-        assert "custom" in fw.verification_criteria
-
-    def test_custom_criterion_used_in_verify(self):
-        fw = ResultsVerificationFramework()
-        fw.add_custom_verification_criterion("always_true", lambda r: True)
-        result = fw.verify_results({"a": 1, "b": 2})
+    def test_add_custom_criterion(self, fw_rw):
+        fw_rw.add_custom_verification_criterion("custom", lambda r: True)
+        assert "custom" in fw_rw.verification_criteria
+
+    def test_custom_criterion_used_in_verify(self, fw_rw):
+        fw_rw.add_custom_verification_criterion("always_true", lambda r: True)
+        result = fw_rw.verify_results({"a": 1, "b": 2})
         assert result["always_true"] is True
 
-    def test_overwrite_existing_criterion(self):
+    def test_overwrite_existing_criterion(self, fw_rw):
         """Adding a criterion with existing name silently overwrites."""
-        fw = ResultsVerificationFramework()
-        fw.add_custom_verification_criterion("specific", lambda r: True)
-        result = fw.verify_results({})  # normally fails specificity
+        fw_rw.add_custom_verification_criterion("specific", lambda r: True)
+        result = fw_rw.verify_results({})  # normally fails specificity
         assert result["specific"] is True  # overwritten to always-true
 
-    def test_non_callable_criterion_rejected(self):
+    def test_non_callable_criterion_rejected(self, fw_ro):
         """Non-callable is now rejected with TypeError."""
-        fw = ResultsVerificationFramework()
         with pytest.raises(TypeError):
-            fw.add_custom_verification_criterion("bad", "not a function")
+            fw_ro.add_custom_verification_criterion("bad", "not a function")
 
-    def test_empty_name_rejected(self):
+    def test_empty_name_rejected(self, fw_ro):
         """Empty name is rejected with ValueError."""
-        fw = ResultsVerificationFramework()
         with pytest.raises(ValueError):
-            fw.add_custom_verification_criterion("", lambda r: True)
+            fw_ro.add_custom_verification_criterion("", lambda r: True)
 
 
 # ── export_verification_history ──────────────────────────────────────────
 
 
 class TestExportHistory:
-    def test_export_creates_file(self, tmp_path):
-        fw = ResultsVerificationFramework()
-        fw.verify_results({"a": 1, "b": 2})
-        filepath = str(tmp_path / "history.json")
-        fw.export_verification_history(filepath)
-        assert os.path.exists(filepath)
-
-    def test_export_valid_json(self, tmp_path):
-        fw = ResultsVerificationFramework()
-        fw.verify_results({"a": 1, "b": 2})
-        filepath = str(tmp_path / "history.json")
-        fw.export_verification_history(filepath)
-        with open(filepath) as f:
-            data = json.load(f)
+    def test_export_creates_file(self, exported_history_path):
+        st = exported_history_path.stat()
+        assert stat.S_ISREG(st.st_mode)
+        assert st.st_size > len(b"[]")
+
+    def test_export_valid_json(self, fw_with_one_history, exported_history_path):
+        text = exported_history_path.read_text()
+        assert text == json.dumps(list(fw_with_one_history.verification_history))
+        data = json.loads(text)
         assert isinstance(data, list)
         assert len(data) == 1
 
-    def test_export_empty_history(self, tmp_path):
-        fw = ResultsVerificationFramework()
-        filepath = str(tmp_path / "history.json")
-        fw.export_verification_history(filepath)
-        with open(filepath) as f:
+    def test_export_empty_history(self, fw_ro, tmp_path):
+        filepath = tmp_path / "history.json"
+        fw_ro.export_verification_history(os.fspath(filepath))
+        with filepath.open() as f:
             data = json.load(f)
         assert data == []
 
-    def test_export_default_filename_writes_to_cwd(self):
-        fw = ResultsVerificationFramework()
-        import inspect
+    def test_unserializable_history_keeps_previous_export(self, fw_rw, tmp_path):
+        fw_rw.verify_results({"a": 1, "b": 2})
+        filepath = tmp_path / "history.json"
+        fw_rw.export_verification_history(os.fspath(filepath))
 
-        sig = inspect.signature(fw.export_verification_history)
-        assert sig.parameters["filename"].default == "verification_history.json"
+        fw_rw.verify_results({"a": object(), "b": 2})
+        with pytest.raises(TypeError):
+            fw_rw.export_verification_history(os.fspath(filepath))
+        with filepath.open() as f:
+            assert len(json.load(f)) == 1
+
+    def test_export_default_filename_writes_to_cwd(self, export_sig):
+        assert export_sig.parameters["filename"].default == "verification_history.json"
 
 
 # ── get_verification_success_rate ────────────────────────────────────────
 
 
 class TestSuccessRate:
-    def test_no_history(self):
-        fw = ResultsVerificationFramework()
-        assert fw.get_verification_success_rate() == 0.0
+    def test_no_history(self, fw_ro):
+        assert fw_ro.get_verification_success_rate() == 0.0
 
-    def test_all_pass_with_good_results(self):
+    def test_all_pass_with_good_results(self, fw_all_good):
         """With bugs fixed, good results can now pass all criteria."""
-        fw = ResultsVerificationFramework()
-        for _ in range(3):
-            fw.verify_results(
-                {
-                    "next_step": "deploy",
-                    "score": 95,
-                    "items": [1, 2, 3],
-                }
-            )
-        assert fw.get_verification_success_rate() == 100.0
-
-    def test_with_manually_valid_history(self):
-        """Test rate calculation by injecting valid history entries."""
-        fw = ResultsVerificationFramework()
-        fw.verification_history = [
-            {"overall_valid": True},
-            {"overall_valid": True},
-            {"overall_valid": False},
-        ]
-        assert fw.get_verification_success_rate() == pytest.approx(66.666, abs=0.01)
-
-    def test_all_valid(self):
-        fw = ResultsVerificationFramework()
-        fw.verification_history = [{"overall_valid": True}] * 5
-        assert fw.get_verification_success_rate() == 100.0
-
-    def test_returns_percentage_not_fraction(self):
-        fw = ResultsVerificationFramework()
-        fw.verification_history = [{"overall_valid": True}]
-        rate = fw.get_verification_success_rate()
-        assert rate == 100.0  # percentage, not 1.0
+        assert fw_all_good.get_verification_success_rate() == 100.0
+
+    @pytest.mark.parametrize(
+        ("valids", "invalids", "expected"),
+        [
+            pytest.param(2, 1, _TWO_THIRDS, id="two-of-three"),
+            pytest.param(5, 0, 100.0, id="all-valid"),
+            # A percentage, not the 1.0 fraction
+            pytest.param(1, 0, 100.0, id="percentage-not-fraction"),
+            pytest.param(0, 0, 0.0, id="empty"),
+            pytest.param(20_000, 10_000, _TWO_THIRDS, id="stress", marks=pytest.mark.slow),
+        ],
+    )
+    def test_rate_from_injected_history(self, make_fw, valids, invalids, expected):
+        rate = make_fw(valids, invalids).get_verification_success_rate()
+        assert rate == pytest.approx(expected)
+
+    def test_rate_tracks_fifo_eviction(self):
+        fw = ResultsVerificationFramework(max_history=3)
+        good = {"next_step": "deploy", "score": 95, "items": [1, 2, 3]}
+        for results in [good, good, {}, {}, good]:
+            fw.verify_results(results)
+        # Window holds [{}, {}, good]
+        assert fw.get_verification_success_rate() == pytest.approx(100 / 3)
+
+    def test_verify_after_history_replaced(self, fw_rw):
+        fw_rw.verify_results({})
+        fw_rw.verification_history = [{"overall_valid": True}]
+        fw_rw.verify_results({"next_step": "deploy", "score": 95, "items": [1, 2, 3]})
+        assert fw_rw.get_verification_success_rate() == 100.0
+
+    def test_rate_counts_direct_appends_to_full_history(self):
+        fw = ResultsVerificationFramework(max_history=2)
+        good = {"next_step": "deploy", "score": 95, "items": [1, 2, 3]}
+        fw.verify_results(good)
+        fw.verify_results(good)
+        # Length stays at max_history while both passing entries are evicted
+        fw.verification_history.append({"overall_valid": False})
+        fw.verification_history.append({"overall_valid": False})
+        assert fw.get_verification_success_rate() == 0.0
@@ -2,23 +2,21 @@
 
 import json
 import os
-from unittest.mock import patch
+import subprocess
 
 import pytest
 
-from self_eval import SelfEvalEngine
+from self_eval import EXPECTED_SERVICES, SelfEvalEngine
 
 
-@pytest.fixture
-def engine(tmp_path):
-    """Create a SelfEvalEngine with tmp dirs."""
-    project_root = str(tmp_path / "project")
-    state_dir = str(tmp_path / "state")
-    workspace_dir = str(tmp_path / "workspace")
-    os.makedirs(project_root)
-    os.makedirs(os.path.join(project_root, "src"))
-    os.makedirs(os.path.join(project_root, "tests"))
-    os.makedirs(state_dir)
+def _make_engine(root):
+    """Create a SelfEvalEngine with project/state/workspace dirs under root."""
+    project_root = str(root / "project")
+    state_dir = str(root / "state")
+    workspace_dir = str(root / "workspace")
+    # Leaf dirs only: makedirs creates project/ on the way, and the engine creates state_dir
+    for sub in ("src", "tests"):
+        os.makedirs(os.path.join(project_root, sub))
     os.makedirs(workspace_dir)
     return SelfEvalEngine(
         project_root=project_root,
@@ -27,63 +25,109 @@ def engine(tmp_path):
     )
 
 
-# ── Grade thresholds ─────────────────────────────────────────────────
+@pytest.fixture(scope="module")
+def shared_engine(tmp_path_factory):
+    """Built once per module; only for tests that never touch its dirs or history."""
+    return _make_engine(tmp_path_factory.mktemp("se"))
 
 
-class TestGradeThresholds:
-    def test_grade_a(self, engine):
-        assert engine._score_to_grade(95) == "A"
+@pytest.fixture
+def engine(tmp_path):
+    """Fresh engine for tests that write files, state or eval history."""
+    return _make_engine(tmp_path)
+
+
+def _completed(returncode: int = 0, stdout: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="")
+
+
+@pytest.fixture
+def subproc(monkeypatch):
+    """Stub subprocess.run; append a CompletedProcess (or an exception to raise) to script it."""
+    results = []
+
+    def run(*args, **kwargs):
+        result = results[-1] if results else _completed()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    monkeypatch.setattr("subprocess.run", run)
+    return results
+
+
+def _healthy_probe(port, timeout=3):
+    return {"healthy": True, "detail": "ok", "port": port, "timestamp": "t"}
+
+
+# Per-port probe results with only the enterprise port (18789) down, built once
+_ENTERPRISE_DOWN_PROBES = {
+    svc["port"]: {
+        "healthy": svc["port"] != 18789,
+        "detail": "ok" if svc["port"] != 18789 else "refused",
+        "port": svc["port"],
+        "timestamp": "t",
+    }
+    for svc in EXPECTED_SERVICES
+}
+
+
+def _enterprise_down_probe(port, timeout=3):
+    return _ENTERPRISE_DOWN_PROBES[port]
+
+
+@pytest.fixture
+def healthy_probes(monkeypatch):
+    """Every expected service answers its port probe, without a MagicMock."""
+    monkeypatch.setattr("self_eval.probe_port", _healthy_probe)
 
-    def test_grade_b(self, engine):
-        assert engine._score_to_grade(85) == "B"
 
-    def test_grade_c(self, engine):
-        assert engine._score_to_grade(75) == "C"
+# ── Construction ─────────────────────────────────────────────────────
 
-    def test_grade_d(self, engine):
-        assert engine._score_to_grade(65) == "D"
 
-    def test_grade_f(self, engine):
-        assert engine._score_to_grade(55) == "F"
+class TestInit:
+    def test_init_does_not_read_history(self, engine, monkeypatch):
+        def no_open(*args, **kwargs):
+            raise AssertionError("__init__ opened a file")
 
-    def test_boundary_a(self, engine):
-        assert engine._score_to_grade(90) == "A"
+        engine._save_eval({"composite_score": 95, "grade": "A"})
+        with monkeypatch.context() as mp:
+            mp.setattr("builtins.open", no_open)
+            rebuilt = SelfEvalEngine(
+                project_root=engine.project_root,
+                state_dir=engine.state_dir,
+                workspace_dir=engine.workspace_dir,
+            )
+        assert rebuilt._load_history() == engine._load_history()
+
+
+# ── Grade thresholds ─────────────────────────────────────────────────
 
-    def test_boundary_b(self, engine):
-        assert engine._score_to_grade(80) == "B"
+
+class TestGradeThresholds:
+    @pytest.mark.parametrize(
+        ("score", "grade"),
+        [(95, "A"), (85, "B"), (75, "C"), (65, "D"), (55, "F"), (90, "A"), (80, "B")],
+    )
+    def test_score_to_grade(self, score, grade):
+        assert SelfEvalEngine._score_to_grade(score) == grade
 
 
 # ── Discovery ────────────────────────────────────────────────────────
 
 
 class TestDiscoverServices:
-    def test_returns_expected_services(self, engine):
-        with patch("self_eval.probe_port") as mock_probe:
-            mock_probe.return_value = {
-                "healthy": True,
-                "detail": "ok",
-                "port": 3000,
-                "timestamp": "t",
-            }
-            services = engine.discover_services()
+    def test_returns_expected_services(self, shared_engine, healthy_probes):
+        services = shared_engine.discover_services()
         assert len(services) == 3
         names = [s["name"] for s in services]
         assert "gateway" in names
         assert "enterprise" in names
         assert "vite-ui" in names
 
-    def test_detects_unhealthy_service(self, engine):
-        def mock_probe(port, timeout=3):
-            healthy = port != 18789
-            return {
-                "healthy": healthy,
-                "detail": "ok" if healthy else "refused",
-                "port": port,
-                "timestamp": "t",
-            }
-
-        with patch("self_eval.probe_port", side_effect=mock_probe):
-            services = engine.discover_services()
+    def test_detects_unhealthy_service(self, shared_engine, monkeypatch):
+        monkeypatch.setattr("self_eval.probe_port", _enterprise_down_probe)
+        services = shared_engine.discover_services()
         enterprise = next(s for s in services if s["name"] == "enterprise")
         assert enterprise["healthy"] is False
         assert enterprise["critical"] is True
@@ -110,32 +154,38 @@ class TestDiscoverRepos:
         assert repos == []
 
 
+@pytest.fixture
+def config_path(engine):
+    """Path of the engine's project pyproject.toml (not created)."""
+    return os.path.join(engine.project_root, "pyproject.toml")
+
+
 class TestDiscoverConfigDrift:
-    def test_first_run_reports_new_files(self, engine):
+    @pytest.fixture(autouse=True)
+    def _no_home(self, monkeypatch):
+        """Point ~ at a missing dir so only project-local config files are tracked."""
+        monkeypatch.setattr("self_eval.os.path.expanduser", lambda path: "/nonexistent")
+
+    def test_first_run_reports_new_files(self, engine, config_path):
         # Create a config file
-        config_path = os.path.join(engine.project_root, "pyproject.toml")
         with open(config_path, "w") as f:
             f.write("[project]\nname = 'test'\n")
 
-        with patch("self_eval.os.path.expanduser", return_value="/nonexistent"):
-            drift = engine.discover_config_drift()
+        drift = engine.discover_config_drift()
         # pyproject.toml should be detected as new
         assert drift["tracked_files"] >= 1
 
-    def test_detects_change(self, engine):
-        config_path = os.path.join(engine.project_root, "pyproject.toml")
+    def test_detects_change(self, engine, config_path):
         with open(config_path, "w") as f:
             f.write("[project]\nname = 'v1'\n")
 
-        with patch("self_eval.os.path.expanduser", return_value="/nonexistent"):
-            engine.discover_config_drift()  # First run
+        engine.discover_config_drift()  # First run
 
         # Change the file
         with open(config_path, "w") as f:
             f.write("[project]\nname = 'v2'\n")
 
-        with patch("self_eval.os.path.expanduser", return_value="/nonexistent"):
-            drift = engine.discover_config_drift()
+        drift = engine.discover_config_drift()
         assert config_path in drift["drifted"]
 
 
@@ -143,37 +193,39 @@ class TestDiscoverConfigDrift:
 
 
 class TestHealLint:
-    def test_heal_lint_success(self, engine):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = type("R", (), {
-                "returncode": 0, "stdout": "All checks passed!", "stderr": ""
-            })()
-            result = engine.heal_lint()
+    def test_heal_lint_success(self, shared_engine, subproc):
+        subproc.append(_completed(stdout="All checks passed!"))
+        result = shared_engine.heal_lint()
         assert result["success"] is True
 
-    def test_heal_lint_not_found(self, engine):
-        with patch("subprocess.run", side_effect=FileNotFoundError("ruff")):
-            result = engine.heal_lint()
+    def test_heal_lint_not_found(self, shared_engine, subproc):
+        subproc.append(FileNotFoundError("ruff"))
+        result = shared_engine.heal_lint()
         assert result["success"] is False
 
 
+def _write_state_file(engine, name, text):
+    """Write a state file into the engine's (tmpfs-backed) state dir and return its path."""
+    path = os.path.join(engine.state_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
 class TestHealState:
     def test_repairs_corrupted_json(self, engine):
         # Create a corrupted state file
-        bad_file = os.path.join(engine.state_dir, "bad.json")
-        with open(bad_file, "w") as f:
-            f.write("{corrupted json{{{")
+        bad_file = _write_state_file(engine, "bad.json", "{corrupted json{{{")
+        backup = bad_file + ".corrupted"
         result = engine.heal_state()
         assert result["count"] == 1
         assert "bad.json" in result["repaired"]
         # Original should be gone, backup should exist
         assert not os.path.exists(bad_file)
-        assert os.path.exists(bad_file + ".corrupted")
+        assert os.path.exists(backup)
 
     def test_leaves_valid_json_alone(self, engine):
-        good_file = os.path.join(engine.state_dir, "good.json")
-        with open(good_file, "w") as f:
-            json.dump({"valid": True}, f)
+        good_file = _write_state_file(engine, "good.json", json.dumps({"valid": True}))
         result = engine.heal_state()
         assert result["count"] == 0
         assert os.path.exists(good_file)
@@ -183,49 +235,31 @@ class TestHealState:
 
 
 class TestEvalLint:
-    def test_lint_pass(self, engine):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = type("R", (), {
-                "returncode": 0, "stdout": "All checks passed!", "stderr": ""
-            })()
-            result = engine.eval_lint()
+    def test_lint_pass(self, shared_engine, subproc):
+        subproc.append(_completed(stdout="All checks passed!"))
+        result = shared_engine.eval_lint()
         assert result["passed"] is True
         assert result["score"] == 100
 
-    def test_lint_fail_with_errors(self, engine):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = type("R", (), {
-                "returncode": 1,
-                "stdout": "src/foo.py:1 E501\nFound 3 errors.\n",
-                "stderr": "",
-            })()
-            result = engine.eval_lint()
+    def test_lint_fail_with_errors(self, shared_engine, subproc):
+        subproc.append(_completed(1, stdout="src/foo.py:1 E501\nFound 3 errors.\n"))
+        result = shared_engine.eval_lint()
         assert result["passed"] is False
         assert result["error_count"] == 3
         assert result["score"] == 85  # 100 - 3*5
 
 
 class TestEvalTests:
-    def test_tests_pass(self, engine):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = type("R", (), {
-                "returncode": 0,
-                "stdout": "343 passed in 2.5s\n",
-                "stderr": "",
-            })()
-            result = engine.eval_tests()
+    def test_tests_pass(self, shared_engine, subproc):
+        subproc.append(_completed(stdout="343 passed in 2.5s\n"))
+        result = shared_engine.eval_tests()
         assert result["all_passed"] is True
         assert result["passed_count"] == 343
         assert result["score"] == 100
 
-    def test_tests_with_failures(self, engine):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = type("R", (), {
-                "returncode": 1,
-                "stdout": "340 passed, 3 failed in 3.0s\n",
-                "stderr": "",
-            })()
-            result = engine.eval_tests()
+    def test_tests_with_failures(self, shared_engine, subproc):
+        subproc.append(_completed(1, stdout="340 passed, 3 failed in 3.0s\n"))
+        result = shared_engine.eval_tests()
         assert result["all_passed"] is False
         assert result["passed_count"] == 340
         assert result["failed_count"] == 3
@@ -235,147 +269,154 @@ class TestEvalTests:
 # ── Full eval ────────────────────────────────────────────────────────
 
 
+# Canned gate results shared across evals; run_full_eval stores them without copying,
+# and must not mutate them. Kept as plain dicts so _save_eval can JSON-encode them.
+_PASSING_GATE = {
+    "score": 100,
+    "passed": True,
+    "all_passed": True,
+    "error_count": 0,
+    "passed_count": 343,
+    "failed_count": 0,
+    "total": 343,
+    "elapsed_seconds": 2,
+}
+_NO_DRIFT = {"drifted": [], "new": [], "tracked_files": 3}
+
+
+def _stub_gates(monkeypatch, engine, lint, typecheck, tests, drift):
+    """Replace the engine's gate methods with plain functions returning canned results."""
+    monkeypatch.setattr(engine, "eval_lint", lambda: lint)
+    monkeypatch.setattr(engine, "eval_typecheck", lambda: typecheck)
+    monkeypatch.setattr(engine, "eval_tests", lambda: tests)
+    monkeypatch.setattr(engine, "discover_config_drift", lambda: drift)
+
+
 class TestRunFullEval:
-    def test_full_eval_returns_all_keys(self, engine):
-        with (
-            patch.object(engine, "eval_lint", return_value={
-                "passed": True, "error_count": 0, "score": 100
-            }),
-            patch.object(engine, "eval_typecheck", return_value={
-                "passed": True, "error_count": 0, "score": 100
-            }),
-            patch.object(engine, "eval_tests", return_value={
-                "all_passed": True, "passed_count": 343, "failed_count": 0,
-                "total": 343, "elapsed_seconds": 2.5, "score": 100
-            }),
-            patch.object(engine, "discover_config_drift", return_value={
-                "drifted": [], "new": [], "tracked_files": 3
-            }),
-        ):
-            report = engine.run_full_eval(include_services=False)
-
-        assert "timestamp" in report
-        assert "lint" in report
-        assert "typecheck" in report
-        assert "tests" in report
-        assert "composite_score" in report
-        assert "grade" in report
-        assert "trend" in report
-
-    def test_full_eval_grade_a_when_all_pass(self, engine):
-        lint_ok = {"score": 100, "passed": True, "error_count": 0}
-        with (
-            patch.object(engine, "eval_lint", return_value=lint_ok),
-            patch.object(engine, "eval_typecheck", return_value=lint_ok),
-            patch.object(engine, "eval_tests", return_value={
-                "score": 100, "all_passed": True, "passed_count": 343,
-                "failed_count": 0, "total": 343, "elapsed_seconds": 2
-            }),
-            patch.object(engine, "discover_config_drift", return_value={
-                "drifted": [], "new": [], "tracked_files": 3
-            }),
-        ):
-            report = engine.run_full_eval(include_services=False)
-
-        assert report["grade"] == "A"
-        assert report["composite_score"] == 100.0
-
-    def test_trend_tracking_across_evals(self, engine):
-        mock_results = {
-            "score": 100,
-            "passed": True,
-            "all_passed": True,
-            "error_count": 0,
-            "passed_count": 343,
-            "failed_count": 0,
-            "total": 343,
-            "elapsed_seconds": 2,
-        }
-        with (
-            patch.object(engine, "eval_lint", return_value=mock_results),
-            patch.object(engine, "eval_typecheck", return_value=mock_results),
-            patch.object(engine, "eval_tests", return_value=mock_results),
-            patch.object(engine, "discover_config_drift", return_value={
-                "drifted": [], "new": [], "tracked_files": 3
-            }),
-        ):
-            report1 = engine.run_full_eval(include_services=False)
-            report2 = engine.run_full_eval(include_services=False)
+    @pytest.mark.parametrize(
+        ("lint_score", "tests_score", "composite", "grade"),
+        [(100, 100, 100.0, "A"), (50, 100, 90.0, "A"), (100, 50, 80.0, "B")],
+        ids=["all-pass", "lint-half", "tests-half"],
+    )
+    def test_full_eval_report(self, engine, monkeypatch, lint_score, tests_score, composite, grade):
+        _stub_gates(
+            monkeypatch,
+            engine,
+            lint={**_PASSING_GATE, "score": lint_score},
+            typecheck=_PASSING_GATE,
+            tests={**_PASSING_GATE, "score": tests_score},
+            drift=_NO_DRIFT,
+        )
+        report = engine.run_full_eval(include_services=False)
+
+        for key in ("timestamp", "lint", "typecheck", "tests", "composite_score", "grade", "trend"):
+            assert key in report
+        assert report["composite_score"] == composite
+        assert report["grade"] == grade
+
+    def test_trend_tracking_across_evals(self, engine, monkeypatch):
+        _stub_gates(
+            monkeypatch,
+            engine,
+            lint=_PASSING_GATE,
+            typecheck=_PASSING_GATE,
+            tests=_PASSING_GATE,
+            drift=_NO_DRIFT,
+        )
+        report1 = engine.run_full_eval(include_services=False)
+        report2 = engine.run_full_eval(include_services=False)
 
         assert report1["trend"]["direction"] == "first_run"
         assert report2["trend"]["previous_score"] is not None
         assert report2["trend"]["direction"] == "stable"
+        # The canned results are shared by reference and must come back untouched
+        assert report2["tests"] is _PASSING_GATE
+        assert _PASSING_GATE["total"] == 343
 
 
 # ── Report generation ────────────────────────────────────────────────
 
 
+# Canned reports shared by the read-only report tests; the generators never mutate them
+_HEALTHY_REPORT = {
+    "timestamp": "2026-02-24T00:00:00Z",
+    "grade": "A",
+    "composite_score": 100.0,
+    "lint": {"passed": True, "error_count": 0, "score": 100},
+    "typecheck": {"passed": True, "error_count": 0, "score": 100},
+    "tests": {
+        "all_passed": True,
+        "passed_count": 343,
+        "failed_count": 0,
+        "total": 343,
+        "elapsed_seconds": 2.5,
+        "score": 100,
+    },
+    "services": {"skipped": True, "score": 100},
+    "trend": {"previous_score": None, "direction": "first_run"},
+    "config_drift": {"drifted": [], "new": [], "tracked_files": 3},
+}
+
+_FAILING_REPORT = {
+    "timestamp": "2026-02-24T00:00:00Z",
+    "grade": "D",
+    "composite_score": 60.0,
+    "lint": {"passed": False, "error_count": 5, "score": 75},
+    "typecheck": {"passed": False, "error_count": 3, "score": 70},
+    "tests": {
+        "all_passed": False,
+        "passed_count": 330,
+        "failed_count": 13,
+        "total": 343,
+        "elapsed_seconds": 3,
+        "score": 96,
+    },
+    "services": {"skipped": True, "score": 100},
+    "trend": {"previous_score": 100, "delta": -40, "direction": "declining"},
+    "config_drift": {"drifted": [], "new": [], "tracked_files": 3},
+}
+
+_GRADE_C_REPORT = {
+    "timestamp": "2026-02-24T00:00:00Z",
+    "grade": "C",
+    "composite_score": 72,
+    "lint": {"passed": True, "error_count": 0, "score": 100},
+    "typecheck": {"passed": True, "error_count": 0, "score": 100},
+    "tests": {
+        "all_passed": False,
+        "passed_count": 300,
+        "failed_count": 43,
+        "total": 343,
+        "elapsed_seconds": 3,
+        "score": 87,
+    },
+    "services": {"skipped": True, "score": 100},
+    "trend": {"previous_score": None, "direction": "first_run"},
+    "config_drift": {"drifted": [], "new": [], "tracked_files": 3},
+}
+
+
 class TestMarkdownReport:
-    def test_generates_valid_markdown(self, engine):
-        report = {
-            "timestamp": "2026-02-24T00:00:00Z",
-            "grade": "A",
-            "composite_score": 100.0,
-            "lint": {"passed": True, "error_count": 0, "score": 100},
-            "typecheck": {"passed": True, "error_count": 0, "score": 100},
-            "tests": {
-                "all_passed": True, "passed_count": 343,
-                "failed_count": 0, "total": 343, "elapsed_seconds": 2.5,
-                "score": 100,
-            },
-            "services": {"skipped": True, "score": 100},
-            "trend": {"previous_score": None, "direction": "first_run"},
-            "config_drift": {"drifted": [], "new": [], "tracked_files": 3},
-        }
-        md = engine.generate_markdown_report(report)
+    def test_generates_valid_markdown(self, shared_engine):
+        md = shared_engine.generate_markdown_report(_HEALTHY_REPORT)
         assert "# Self-Optimization Health Report" in md
         assert "Grade: A" in md
         assert "PASS" in md
         assert "All Clear" in md
 
-    def test_report_shows_failures(self, engine):
-        report = {
-            "timestamp": "2026-02-24T00:00:00Z",
-            "grade": "D",
-            "composite_score": 60.0,
-            "lint": {"passed": False, "error_count": 5, "score": 75},
-            "typecheck": {"passed": False, "error_count": 3, "score": 70},
-            "tests": {
-                "all_passed": False, "passed_count": 330,
-                "failed_count": 13, "total": 343, "elapsed_seconds": 3,
-                "score": 96,
-            },
-            "services": {"skipped": True, "score": 100},
-            "trend": {"previous_score": 100, "delta": -40, "direction": "declining"},
-            "config_drift": {"drifted": [], "new": [], "tracked_files": 3},
-        }
-        md = engine.generate_markdown_report(report)
+    def test_report_shows_failures(self, shared_engine):
+        md = shared_engine.generate_markdown_report(_FAILING_REPORT)
         assert "Action Required" in md
         assert "FAIL" in md
 
 
 class TestGitHubIssueBody:
-    def test_no_issue_for_healthy(self, engine):
+    def test_no_issue_for_healthy(self, shared_engine):
         report = {"grade": "A", "composite_score": 100}
-        assert engine.generate_github_issue_body(report) is None
-
-    def test_issue_for_grade_c(self, engine):
-        report = {
-            "timestamp": "2026-02-24T00:00:00Z",
-            "grade": "C",
-            "composite_score": 72,
-            "lint": {"passed": True, "error_count": 0, "score": 100},
-            "typecheck": {"passed": True, "error_count": 0, "score": 100},
-            "tests": {
-                "all_passed": False, "passed_count": 300,
-                "failed_count": 43, "total": 343, "elapsed_seconds": 3,
-                "score": 87,
-            },
-            "services": {"skipped": True, "score": 100},
-            "trend": {"previous_score": None, "direction": "first_run"},
-            "config_drift": {"drifted": [], "new": [], "tracked_files": 3},
-        }
-        body = engine.generate_github_issue_body(report)
+        assert shared_engine.generate_github_issue_body(report) is None
+
+    def test_issue_for_grade_c(self, shared_engine):
+        body = shared_engine.generate_github_issue_body(_GRADE_C_REPORT)
         assert body is not None
         assert "Grade: C" in body
         assert "automatically" in body
@@ -392,10 +433,13 @@ class TestHistory:
         assert len(history) == 2
 
     def test_history_capped_at_90(self, engine):
-        for i in range(100):
-            engine._save_eval({"composite_score": i, "grade": "A"})
+        engine._save_eval({"composite_score": -1, "grade": "F"})
+        engine._save_eval_batch([{"composite_score": i, "grade": "A"} for i in range(100)])
         history = engine._load_history()
         assert len(history) == 90
+        # Oldest entries are dropped first, including the one saved before the batch
+        assert history[0]["composite_score"] == 10
+        assert history[-1]["composite_score"] == 99
 
     def test_trend_summary(self, engine):
         engine._save_eval({"composite_score": 80, "tests": {"total": 300}})
@@ -407,24 +451,13 @@ class TestHistory:
 
 
 class TestEvalServices:
-    def test_all_healthy(self, engine):
-        with patch("self_eval.probe_port") as mock_probe:
-            mock_probe.return_value = {
-                "healthy": True, "detail": "ok", "port": 3000, "timestamp": "t"
-            }
-            result = engine.eval_services()
+    def test_all_healthy(self, shared_engine, healthy_probes):
+        result = shared_engine.eval_services()
         assert result["score"] == 100
         assert result["critical_down"] == []
 
-    def test_critical_service_down_penalized(self, engine):
-        def mock_probe(port, timeout=3):
-            healthy = port != 18789
-            return {
-                "healthy": healthy, "detail": "ok" if healthy else "down",
-                "port": port, "timestamp": "t",
-            }
-
-        with patch("self_eval.probe_port", side_effect=mock_probe):
-            result = engine.eval_services()
+    def test_critical_service_down_penalized(self, shared_engine, monkeypatch):
+        monkeypatch.setattr("self_eval.probe_port", _enterprise_down_probe)
+        result = shared_engine.eval_services()
         assert "enterprise" in result["critical_down"]
         assert result["score"] < 100